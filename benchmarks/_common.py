@@ -0,0 +1,34 @@
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT) # Run from a checkout without installing
+
+from tictactoe import TicTacToe
+
+def random_opening(size, n_moves, seed):
+    # Non-terminal sequence of n_moves alternating moves, X first
+    rng = random.Random(seed)
+    game = TicTacToe(size)
+    moves = []
+    player = "X"
+    while len(moves) < n_moves:
+        candidates = game.get_available_moves()
+        rng.shuffle(candidates)
+        for r, c in candidates:
+            trial = game.copy()
+            trial.make_move(r, c, player)
+            if not trial.check_winner()[0]:
+                break
+        game.make_move(r, c, player)
+        moves.append((r, c, player))
+        player = "O" if player == "X" else "X"
+    return moves
+
+def build_game(game_cls, size, moves):
+    game = game_cls(size)
+    for r, c, player in moves:
+        game.make_move(r, c, player)
+    game.current_player = "O" if len(moves) % 2 else "X"
+    return game
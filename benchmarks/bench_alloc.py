@@ -0,0 +1,117 @@
+# Allocation profile of one MinimaxAI search: copy-per-node vs in-place make/unmake.
+# 'peak KiB' is measured with tracemalloc for both searches. 'copies' counts calls to
+# TicTacToe.copy, and 'copy blocks' is that times the blocks one copy allocates (measured
+# once): the churn the copying search adds, which make/unmake removes. Times are the best
+# of a few runs with tracemalloc off.
+# Usage: python benchmarks/bench_alloc.py
+import gc
+import math
+import random
+import time
+import tracemalloc
+
+from _common import build_game, random_opening
+from tictactoe import MinimaxAI, TicTacToe
+from tictactoe.transposition import get_zobrist_keys
+
+class CopyingMinimaxAI(MinimaxAI):
+    # The search as it was before make/unmake: one TicTacToe copy per child node
+    def get_best_move(self):
+        if self.difficulty == "Medium": random.random() # Keep the RNG in step with MinimaxAI
+        best_score, best_move = -math.inf, None
+        alpha, beta = -math.inf, math.inf
+        available_moves = self.game.get_available_moves()
+        random.shuffle(available_moves)
+        for row, col in available_moves:
+            game_copy = self.game.copy()
+            game_copy.make_move(row, col, "O")
+            score = self.minimax_alpha_beta(game_copy, 0, False, alpha, beta)
+            if score > best_score:
+                best_score, best_move = score, (row, col)
+            alpha = max(alpha, best_score)
+            if best_score == 1: return best_move
+        return best_move
+
+    def minimax_alpha_beta(self, game, depth, is_maximizing_player, alpha, beta):
+        winner, _, _ = game.check_winner()
+        if winner == "O": return 1
+        if winner == "X": return -1
+        if game.is_board_full(): return 0
+        max_depth = 4 if self.difficulty == "Medium" else 8
+        if depth >= max_depth: return 0
+        player = "O" if is_maximizing_player else "X"
+        best_score = -math.inf if is_maximizing_player else math.inf
+        for r, c in game.get_available_moves():
+            game_copy = game.copy(); game_copy.make_move(r, c, player)
+            score = self.minimax_alpha_beta(game_copy, depth + 1, not is_maximizing_player, alpha, beta)
+            if is_maximizing_player:
+                best_score = max(score, best_score); alpha = max(alpha, best_score)
+            else:
+                best_score = min(score, best_score); beta = min(beta, best_score)
+            if beta <= alpha: break
+        return best_score
+
+TIME_NOTE = """
+make/unmake removes the copies, but MinimaxAI also does more per node than the copying
+search: it toggles Zobrist hashes for all 8 symmetries on every make and unmake, probes
+the (empty) transposition table and keeps search statistics. A 3x3 or 4x4 copy is only
+a few short lists, so where it is slower above, that bookkeeping costs more than the
+copies it saves. The gain this measures is allocation: a lower peak and no copy churn."""
+
+# (label, size, difficulty, opening length)
+SCENARIOS = [("3x3 Hard", 3, "Hard", 1), ("4x4 Hard", 4, "Hard", 8), ("4x4 Medium", 4, "Medium", 4)]
+
+def blocks_per_copy(game):
+    # Memory blocks allocated by a single game.copy(), measured rather than assumed
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    game_copy = game.copy()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del game_copy
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+
+def profile(ai_cls, size, difficulty, opening, seed):
+    game = build_game(TicTacToe, size, opening)
+    # Per-node churn only: no caches, and row-major order with draw-scored horizons like the copying search
+    ai = ai_cls(game, difficulty, tt_size=0, use_perfect_db=False, move_ordering=False, heuristic=False)
+    copies = 0
+    original_copy = TicTacToe.copy
+    def counting_copy(self):
+        nonlocal copies
+        copies += 1
+        return original_copy(self)
+    TicTacToe.copy = counting_copy
+    get_zobrist_keys(size) # Built once per size; not part of a search
+    random.seed(seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        move = ai.get_best_move()
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        TicTacToe.copy = original_copy
+    elapsed = min(timed_search(ai, seed) for _ in range(3)) # Tracing slows every allocation down
+    return move, peak, copies, copies * blocks_per_copy(game), elapsed
+
+def timed_search(ai, seed):
+    random.seed(seed)
+    start = time.perf_counter()
+    ai.get_best_move()
+    return time.perf_counter() - start
+
+def main():
+    print(f"{'scenario':<14}{'search':<12}{'peak KiB':>10}{'copies':>9}{'copy blocks':>13}{'time (s)':>10}")
+    for label, size, difficulty, n_moves in SCENARIOS:
+        opening = random_opening(size, n_moves, seed=7)
+        moves = {}
+        for name, ai_cls in [("copy", CopyingMinimaxAI), ("make/unmake", MinimaxAI)]:
+            move, peak, copies, blocks, elapsed = profile(ai_cls, size, difficulty, opening, seed=7)
+            moves[name] = move
+            print(f"{label:<14}{name:<12}{peak / 1024:>10.1f}{copies:>9}{blocks:>13}{elapsed:>10.3f}")
+        assert moves["copy"] == moves["make/unmake"], "searches chose different moves"
+    print(TIME_NOTE)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Side-by-side nodes-per-second for the list-of-lists TicTacToe and BitboardTicTacToe.
+# Usage: python benchmarks/bench_board.py
+import random
+import time
+
+from _common import build_game, random_opening
+from tictactoe import BitboardTicTacToe, MinimaxAI, TicTacToe
+
+# (size, difficulty, opening length, number of positions)
+SCENARIOS = [(3, "Hard", 1, 8), (3, "Hard", 2, 8), (4, "Medium", 6, 4), (4, "Hard", 9, 3)]
+
+def run(game_cls, size, difficulty, openings):
+    nodes, elapsed, moves = 0, 0.0, []
+    for seed, opening in enumerate(openings):
+        ai = MinimaxAI(build_game(game_cls, size, opening), difficulty, use_perfect_db=False)
+        random.seed(seed) # Same root shuffle for both backends
+        start = time.perf_counter()
+        moves.append(ai.get_best_move())
+        elapsed += time.perf_counter() - start
+        nodes += ai.last_stats.nodes
+    return nodes, elapsed, moves
+
+def main():
+    print(f"{'scenario':<22}{'backend':<12}{'nodes':>10}{'time (s)':>10}{'nodes/s':>12}")
+    for size, difficulty, n_moves, count in SCENARIOS:
+        openings = [random_opening(size, n_moves, seed) for seed in range(count)]
+        label = f"{size}x{size} {difficulty} +{n_moves}"
+        results = {}
+        for name, game_cls in [("list", TicTacToe), ("bitboard", BitboardTicTacToe)]:
+            nodes, elapsed, moves = run(game_cls, size, difficulty, openings)
+            results[name] = moves
+            print(f"{label:<22}{name:<12}{nodes:>10}{elapsed:>10.3f}{nodes / elapsed:>12,.0f}")
+        assert results["list"] == results["bitboard"], "backends chose different moves"
+
+if __name__ == "__main__":
+    main()
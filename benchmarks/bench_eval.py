@@ -0,0 +1,55 @@
+# Playing strength and search speed at a fixed depth with the line evaluator scoring
+# horizon positions ("on"), against scoring them as draws ("off").
+# Usage: python benchmarks/bench_eval.py
+import random
+import time
+
+from _common import build_game, random_opening
+from tictactoe import BitboardTicTacToe, MinimaxAI
+
+# (size, fixed depth, games per scenario)
+SCENARIOS = [(4, 2, 40), (4, 4, 40), (5, 2, 40), (5, 3, 40)]
+BLOCK_RATE = 0.7 # How often the sparring partner blocks an immediate win
+
+def play(size, depth, seed, heuristic):
+    # The AI (O) against a sparring partner (X) that moves at random but usually blocks;
+    # full-line games between two searchers at equal depth are almost always drawn
+    ai = MinimaxAI(None, "Hard", use_perfect_db=False, search_depth=depth, heuristic=heuristic)
+    rng = random.Random(seed)
+    random.seed(seed)
+    game = BitboardTicTacToe(size)
+    mark = "X" if seed % 2 == 0 else "O"
+    while True:
+        if mark == "O":
+            move = ai.get_best_move(game)
+        else:
+            moves = game.get_available_moves()
+            blocks = [m for m in moves if game.is_winning_move(*m, "O")]
+            move = blocks[0] if blocks and rng.random() < BLOCK_RATE else rng.choice(moves)
+        game.make_move(*move, mark)
+        winner, _, _ = game.check_winner()
+        if winner: return winner
+        if game.is_board_full(): return None
+        mark = "O" if mark == "X" else "X"
+
+def throughput(size, depth, heuristic, seeds=4):
+    nodes, elapsed = 0, 0.0
+    for seed in range(seeds):
+        ai = MinimaxAI(None, "Hard", tt_size=0, use_perfect_db=False, search_depth=depth, heuristic=heuristic)
+        game = build_game(BitboardTicTacToe, size, random_opening(size, 4, seed))
+        random.seed(seed)
+        start = time.perf_counter()
+        ai.get_best_move(game)
+        elapsed += time.perf_counter() - start
+        nodes += ai.last_stats.nodes
+    return nodes / elapsed
+
+def main():
+    print(f"{'scenario':<16}{'games':>7}{'wins off':>10}{'wins on':>9}{'nodes/s off':>13}{'nodes/s on':>12}")
+    for size, depth, games in SCENARIOS:
+        wins = {h: sum(play(size, depth, seed, h) == "O" for seed in range(games)) for h in (False, True)}
+        off, on = throughput(size, depth, False), throughput(size, depth, True)
+        print(f"{f'{size}x{size} depth {depth}':<16}{games:>7}{wins[False]:>10}{wins[True]:>9}{off:>13,.0f}{on:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# Move latency on k-in-a-row boards: AI-vs-AI games under a per-move budget, with the
+# worst reply, nodes/s, depth reached and how many candidate moves the sparse
+# generator hands the search compared to every empty cell.
+# Usage: python benchmarks/bench_kinarow.py
+import random
+import time
+
+import _common # Puts the repo root on sys.path
+from tictactoe import KInARowTicTacToe, MinimaxAI
+from tictactoe.selfplay import _as_o
+
+# (size, k, per-move budget in ms, games)
+SCENARIOS = [(7, 4, 300, 4), (7, 4, 800, 2), (15, 5, 300, 4), (15, 5, 800, 2)]
+
+def play(size, k, budget_ms, seed):
+    random.seed(seed)
+    ais = {mark: MinimaxAI(None, "Hard", time_limit_ms=budget_ms) for mark in "XO"}
+    game = KInARowTicTacToe(size, k)
+    mark = "X"
+    samples = [] # (seconds, nodes, depth, candidates, empty cells)
+    while True:
+        candidates = len(game.get_available_moves())
+        empty = size * size - len(game.moves)
+        start = time.perf_counter()
+        move = ais[mark].get_best_move(_as_o(game, mark))
+        stats = ais[mark].last_stats
+        samples.append((time.perf_counter() - start, stats.nodes, stats.depth_completed, candidates, empty))
+        game.make_move(*move, mark)
+        winner, _, _ = game.check_winner()
+        if winner or game.is_board_full(): return samples
+        mark = "O" if mark == "X" else "X"
+
+def main():
+    print(f"{'scenario':<22}{'moves':>7}{'mean ms':>9}{'worst ms':>10}{'nodes/s':>10}{'depth':>7}{'candidates':>12}")
+    for size, k, budget_ms, games in SCENARIOS:
+        samples = [sample for seed in range(games) for sample in play(size, k, budget_ms, seed)]
+        seconds = sum(s[0] for s in samples)
+        nodes = sum(s[1] for s in samples)
+        depth = sum(s[2] for s in samples) / len(samples)
+        candidates = sum(s[3] for s in samples) / sum(s[4] for s in samples)
+        label = f"{size}x{size} k={k} {budget_ms}ms"
+        print(f"{label:<22}{len(samples):>7}{1000 * seconds / len(samples):>9.1f}{1000 * max(s[0] for s in samples):>10.1f}"
+              f"{nodes / seconds:>10,.0f}{depth:>7.1f}{candidates:>12.1%}")
+
+if __name__ == "__main__":
+    main()
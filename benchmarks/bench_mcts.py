@@ -0,0 +1,61 @@
+# MCTSAI against MinimaxAI at the same per-move budget on 4x4, 5x5 and 7x7
+# four-in-a-row, plus playouts per second (bare playouts, and full UCT iterations
+# from an opening). First checks that a tree kept from one board size is not reused
+# on another whose bitboards happen to match.
+# Usage: python benchmarks/bench_mcts.py [games per match]
+import sys
+import time
+
+from _common import build_game, random_opening
+from tictactoe import BitboardTicTacToe, MCTSAI
+from tictactoe.mcts import _playout, get_cell_masks
+from tictactoe.selfplay import parse_player, run_tournament
+
+# (size, k, per-move budget in ms)
+MATCHES = [(4, 4, 100), (4, 4, 300), (5, 5, 100), (5, 5, 300), (7, 4, 300)]
+
+def playout_rate(size, count=20_000):
+    masks = get_cell_masks(size, size)
+    full_mask = (1 << (size * size)) - 1
+    start = time.perf_counter()
+    for _ in range(count):
+        _playout(0, 0, "X", full_mask, masks)
+    return count / (time.perf_counter() - start)
+
+def search_rate(size, seeds=4, playouts=5_000):
+    total, elapsed = 0, 0.0
+    for seed in range(seeds):
+        ai = MCTSAI(None, playouts=playouts)
+        game = build_game(BitboardTicTacToe, size, random_opening(size, 2, seed))
+        ai.get_best_move(game)
+        total += ai.last_stats.leaf_evaluations
+        elapsed += ai.last_stats.wall_time_ms / 1000
+    return total / elapsed
+
+def check_cross_size_reuse():
+    # X at (1, 2) on 3x3 and at (1, 1) on 4x4 are both bit 5: the 4x4 search must grow its
+    # own tree, whose root children are exactly the free 4x4 cells
+    ai = MCTSAI(None, playouts=500)
+    ai.get_best_move(build_game(BitboardTicTacToe, 3, [(1, 2, "X")]))
+    game = build_game(BitboardTicTacToe, 4, [(1, 1, "X")])
+    move = ai.get_best_move(game)
+    children = {child.move for child in ai.root.children}
+    assert children == set(game.get_available_moves()) and move in children, "4x4 search reused the 3x3 tree"
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    check_cross_size_reuse()
+    print(f"{'size':<6}{'bare playouts/s':>17}{'UCT playouts/s':>16}")
+    for size in (3, 4, 5):
+        print(f"{f'{size}x{size}':<6}{playout_rate(size):>17,.0f}{search_rate(size):>16,.0f}")
+    print(f"\n{'match':<30}{'games':>7}{'MCTS win':>10}{'draw':>7}{'loss':>7}")
+    for size, k, budget_ms in MATCHES:
+        players = {"A": parse_player(f"MCTS:{budget_ms}"), "B": parse_player(f"Hard:{budget_ms}")}
+        results = list(run_tournament(games, size, players, k=k))
+        wins = sum(r["winner"] == "A" for r in results)
+        losses = sum(r["winner"] == "B" for r in results)
+        label = f"{size}x{size} k={k} MCTS vs Hard {budget_ms}ms"
+        print(f"{label:<30}{games:>7}{wins:>10}{games - wins - losses:>7}{losses:>7}")
+
+if __name__ == "__main__":
+    main()
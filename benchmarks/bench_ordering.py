@@ -0,0 +1,38 @@
+# Nodes searched at a fixed depth with and without move ordering (threat-first,
+# killers, history, center/corner), with the transposition table on and off.
+# Usage: python benchmarks/bench_ordering.py
+import random
+import time
+
+from _common import build_game, random_opening
+from tictactoe import BitboardTicTacToe, MinimaxAI
+
+# (size, fixed depth, opening length, number of positions)
+SCENARIOS = [(3, 8, 1, 8), (4, 6, 4, 6), (5, 4, 4, 4)]
+
+def run(size, depth, openings, move_ordering, tt_size):
+    nodes, elapsed = 0, 0.0
+    for seed, opening in enumerate(openings):
+        ai = MinimaxAI(None, "Hard", tt_size=tt_size, use_perfect_db=False, move_ordering=move_ordering, search_depth=depth)
+        game = build_game(BitboardTicTacToe, size, opening)
+        random.seed(seed)
+        start = time.perf_counter()
+        ai.get_best_move(game)
+        elapsed += time.perf_counter() - start
+        nodes += ai.last_stats.nodes
+    return nodes, elapsed
+
+def main():
+    print(f"{'scenario':<18}{'table':<7}{'ordering':<10}{'nodes':>11}{'time (s)':>10}{'nodes saved':>13}")
+    for size, depth, n_moves, count in SCENARIOS:
+        openings = [random_opening(size, n_moves, seed) for seed in range(count)]
+        label = f"{size}x{size} depth {depth}"
+        for tt_size, table in ((0, "off"), (200_000, "on")):
+            baseline = None
+            for move_ordering, name in ((False, "none"), (True, "full")):
+                nodes, elapsed = run(size, depth, openings, move_ordering, tt_size)
+                baseline = baseline or nodes
+                print(f"{label:<18}{table:<7}{name:<10}{nodes:>11,}{elapsed:>10.2f}{1 - nodes / baseline:>13.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Root-parallel MinimaxAI scaling on 4x4: wall time and speedup at 1, 2, 4 and 8 workers,
+# checking that every worker count picks the same move as the serial search. Tables are
+# reset per position; the pool is kept, so its startup is timed only once per worker count.
+# Usage: python benchmarks/bench_parallel.py
+import os
+import random
+import time
+
+from _common import build_game, random_opening
+from tictactoe import MinimaxAI, TicTacToe
+
+WORKER_COUNTS = [1, 2, 4, 8]
+POSITIONS = [random_opening(4, n_moves, seed) for seed, n_moves in enumerate([3, 4, 4, 5, 5, 6])]
+
+def run(workers):
+    ai = MinimaxAI(None, "Hard", workers=workers)
+    moves, elapsed = [], 0.0
+    try:
+        for seed, opening in enumerate(POSITIONS):
+            game = build_game(TicTacToe, 4, opening)
+            ai.reset_tables() # Parallel and serial only pick the same move from the same tables
+            random.seed(seed) # Same root order for every worker count
+            start = time.perf_counter()
+            moves.append(ai.get_best_move(game))
+            elapsed += time.perf_counter() - start
+    finally:
+        ai.close()
+    return moves, elapsed
+
+def main():
+    print(f"{len(POSITIONS)} positions, 4x4 Hard, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'time (s)':>10}{'speedup':>10}")
+    serial_moves, serial_time = None, None
+    for workers in WORKER_COUNTS:
+        moves, elapsed = run(workers)
+        if serial_moves is None:
+            serial_moves, serial_time = moves, elapsed
+        assert moves == serial_moves, f"{workers} workers chose {moves}, serial chose {serial_moves}"
+        print(f"{workers:>8}{elapsed:>10.2f}{serial_time / elapsed:>10.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Game log throughput: appends a million random games, then streams them back with
+# read_games, reporting games/s, MB/s and the reader's peak Python allocation, which
+# stays near one read chunk however long the log is.
+# Usage: python benchmarks/bench_records.py [games]
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import _common # Puts the repo root on sys.path
+from tictactoe.gamelog import FILE_HEADER, GAMES_MAGIC, GAMES_VERSION, encode_game, read_games
+
+VARIANTS = [(3, 3), (4, 4), (5, 5)]
+
+def random_games(count, seed=0):
+    # Random legal move orders, cut at a random length; the reader doesn't check wins
+    rng = random.Random(seed)
+    for _ in range(count):
+        size, k = rng.choice(VARIANTS)
+        cells = rng.sample(range(size * size), rng.randint(5, size * size))
+        player = rng.choice("XO")
+        moves = []
+        for cell in cells:
+            moves.append((cell // size, cell % size, player))
+            player = "O" if player == "X" else "X"
+        yield size, k, moves, rng.choice(("X", "O", "draw"))
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    path = os.path.join(tempfile.mkdtemp(), "games.log")
+    start = time.perf_counter()
+    with open(path, "wb") as f: # Bulk write; save_game does one locked append per game
+        f.write(GAMES_MAGIC + bytes([GAMES_VERSION, 0, 0, 0]))
+        for game in random_games(count):
+            f.write(encode_game(*game))
+    write_s = time.perf_counter() - start
+    mb = (os.path.getsize(path) - FILE_HEADER) / (1 << 20)
+    print(f"{count:,} games, {mb:.1f} MB ({mb * (1 << 20) / count:.1f} bytes/game)")
+    print(f"encode + write  {count / write_s:>12,.0f} games/s")
+
+    start = time.perf_counter()
+    games = moves = 0
+    for _, _, game_moves, _ in read_games(path):
+        games += 1
+        moves += len(game_moves)
+    read_s = time.perf_counter() - start
+    print(f"stream read     {games / read_s:>12,.0f} games/s  {mb / read_s:.1f} MB/s  {moves / read_s:,.0f} moves/s")
+
+    tracemalloc.start() # Separate pass over a prefix: tracing slows the reader down several times
+    for _ in itertools.islice(read_games(path), 200_000):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"reader peak     {peak / (1 << 20):>12.1f} MB")
+    os.remove(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# Regression suite for the game core and MinimaxAI over a fixed corpus of 3x3, 4x4 and
+# 5x5 positions: ns per check_winner / get_available_moves / copy on both backends, and
+# per search the chosen move, nodes, latency and nodes/s. Timings are the best of a few
+# fresh runs. `save` writes a baseline; `compare` reruns and exits 1 if any search picks
+# a different move or a timing is worse than the baseline by more than the threshold.
+# Each timing is scaled by a fixed pure-Python workload timed right before it, which
+# takes out machine-wide slowdowns; timings still only mean much on the machine the
+# baseline was saved on. Moves compare anywhere: baselines/reference.json is checked in.
+# Usage:
+#   python benchmarks/bench_regression.py save             # baselines/local.json, for this machine
+#   python benchmarks/bench_regression.py compare          # exit 1 on a slowdown or a changed move
+#   python benchmarks/bench_regression.py compare --baseline reference --moves-only
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+
+import _common # Puts the repo root on sys.path
+from tictactoe import BitboardTicTacToe, MinimaxAI, TicTacToe
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# (name, board rows top to bottom with "/" between rows, difficulties searched). O is to
+# move in every position. Hard is left out where one search takes more than a few seconds.
+CORPUS = [
+    ("3x3 opening a", ".../.X./...", ("Medium", "Hard")),
+    ("3x3 opening b", ".../.../XO.", ("Medium", "Hard")),
+    ("3x3 midgame a", "X../.../O.X", ("Medium", "Hard")),
+    ("3x3 midgame b", ".O./.O./.XX", ("Medium", "Hard")),
+    ("3x3 endgame a", "O.O/..X/X.X", ("Medium", "Hard")),
+    ("3x3 endgame b", "XOO/X../OX.", ("Medium", "Hard")),
+    ("4x4 opening a", "O.../..../...X/....", ("Medium",)),
+    ("4x4 opening b", "..../..../.O../X.X.", ("Medium", "Hard")),
+    ("4x4 midgame a", "XXO./XO../..X./...O", ("Medium", "Hard")),
+    ("4x4 midgame b", "X.../..OO/X..X/XOO.", ("Medium", "Hard")),
+    ("4x4 endgame a", "O.XO/XXX./X.OO/..OX", ("Medium", "Hard")),
+    ("4x4 endgame b", "O.O./O.OX/XXOX/O.XX", ("Medium", "Hard")),
+    ("5x5 opening a", ".O.O./.X.../...../...X./.....", ("Medium",)),
+    ("5x5 opening b", "...../..XX./...../X.O../O....", ("Medium",)),
+    ("5x5 midgame a", "OX.../O.OX./O..X./.O.../.X..X", ("Medium",)),
+    ("5x5 midgame b", ".O.OX/XXX../.OXO./.O.../..X..", ("Medium", "Hard")),
+    ("5x5 endgame a", "O.OOO/OXXXX/..XOX/OXO../.XXO.", ("Medium", "Hard")),
+    ("5x5 endgame b", "OO.XO/X.OOX/O...O/XX.XX/XOOXX", ("Medium", "Hard")),
+]
+BACKENDS = [("list", TicTacToe), ("bitboard", BitboardTicTacToe)]
+CORE_OPS = ["check_winner", "get_available_moves", "copy"]
+MIN_RUNS, RUN_BUDGET_S = 3, 0.5 # Each search repeats at least MIN_RUNS times, and until RUN_BUDGET_S has passed
+MIN_FLAG_MS = 1.0 # Searches faster than this are reported but too noisy to fail on
+
+def calibrate():
+    # Best ms for a workload no change to the package can affect
+    return min(timeit.repeat(lambda: sum(i * i for i in range(100_000)), number=1, repeat=7)) * 1000
+
+def load_position(game_cls, board):
+    rows = board.split("/")
+    game = game_cls(len(rows))
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            if cell != ".": game.make_move(r, c, cell)
+    game.current_player = "O"
+    return game
+
+def time_core(game_cls, board, op):
+    # Best ns per call over 5 timeit repeats
+    game = load_position(game_cls, board)
+    call = getattr(game, op)
+    loops = 2_000
+    return min(timeit.repeat(call, number=loops, repeat=5)) / loops * 1e9
+
+def time_search(board, difficulty):
+    # A fresh AI and the same RNG seed every run, so every run searches the same tree
+    runs, best_s, total_s = 0, None, 0.0
+    while runs < MIN_RUNS or total_s < RUN_BUDGET_S:
+        game = load_position(TicTacToe, board)
+        ai = MinimaxAI(game, difficulty, use_perfect_db=False)
+        random.seed(0)
+        start = time.perf_counter()
+        move = ai.get_best_move()
+        elapsed = time.perf_counter() - start
+        runs += 1
+        total_s += elapsed
+        best_s = elapsed if best_s is None else min(best_s, elapsed)
+    nodes = ai.last_stats.nodes
+    return {"move": list(move), "nodes": nodes, "ms": best_s * 1000, "nodes_per_s": nodes / best_s if best_s else 0.0}
+
+def run_suite(stream=sys.stderr):
+    results = {"core": {}, "search": {}}
+    for backend, game_cls in BACKENDS:
+        for size in (3, 4, 5):
+            boards = [board for name, board, _ in CORPUS if name.startswith(f"{size}x{size}")]
+            for op in CORE_OPS:
+                calibration_ms = calibrate()
+                ns = sum(time_core(game_cls, board, op) for board in boards) / len(boards)
+                results["core"][f"{backend} {size}x{size} {op}"] = {"ns": ns, "calibration_ms": calibration_ms}
+    for name, board, difficulties in CORPUS:
+        for difficulty in difficulties:
+            key = f"{name} {difficulty}"
+            calibration_ms = calibrate()
+            results["search"][key] = dict(time_search(board, difficulty), calibration_ms=calibration_ms)
+            print(f"  {key:<24}{results['search'][key]['ms']:>10.1f} ms", file=stream)
+    return results
+
+def print_results(results):
+    print(f"{'core op':<40}{'ns/call':>10}")
+    for key, value in results["core"].items():
+        print(f"{key:<40}{value['ns']:>10,.0f}")
+    print(f"\n{'search':<24}{'move':>8}{'nodes':>10}{'ms':>10}{'nodes/s':>12}")
+    for key, value in results["search"].items():
+        move = f"{value['move'][0]},{value['move'][1]}"
+        print(f"{key:<24}{move:>8}{value['nodes']:>10,}{value['ms']:>10.1f}{value['nodes_per_s']:>12,.0f}")
+
+def compare(baseline, results, threshold, raw=False, moves_only=False):
+    # Prints one line per measurement and returns the list of failures
+    def scale(old, new):
+        # How much faster the machine ran the baseline's measurement than this one
+        return 1.0 if raw else old["calibration_ms"] / new["calibration_ms"]
+
+    failures = []
+    rows = [] # (key, metric, old, new, worse by, can fail)
+    for key, old in baseline["core"].items():
+        new = results["core"].get(key)
+        if new is None: continue
+        ns = new["ns"] * scale(old, new)
+        rows.append((key, "ns", old["ns"], ns, ns / old["ns"] - 1, True))
+    for key, old in baseline["search"].items():
+        new = results["search"].get(key)
+        if new is None: continue
+        if new["move"] != old["move"]:
+            failures.append(f"{key}: move changed from {tuple(old['move'])} to {tuple(new['move'])}")
+        noisy = old["ms"] < MIN_FLAG_MS
+        ms = new["ms"] * scale(old, new)
+        rows.append((key, "ms", old["ms"], ms, ms / old["ms"] - 1, not noisy))
+        nodes_per_s = new["nodes_per_s"] / scale(old, new)
+        if old["nodes_per_s"] and nodes_per_s:
+            rows.append((key, "nodes/s", old["nodes_per_s"], nodes_per_s, old["nodes_per_s"] / nodes_per_s - 1, not noisy))
+        if new["nodes"] != old["nodes"]:
+            print(f"note: {key} searched {new['nodes']:,} nodes, was {old['nodes']:,}")
+    print(f"{'measurement':<48}{'baseline':>12}{'now':>12}{'change':>9}")
+    for key, metric, old, new, worse, can_fail in rows:
+        flag = " REGRESSION" if can_fail and not moves_only and worse > threshold else ""
+        print(f"{key + ' ' + metric:<48}{old:>12,.1f}{new:>12,.1f}{worse:>+9.1%}{flag}")
+        if flag: failures.append(f"{key}: {metric} {worse:+.1%} (threshold {threshold:.0%})")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game core and AI against a saved baseline.")
+    parser.add_argument("command", choices=("run", "save", "compare"))
+    parser.add_argument("--baseline", default="local", help="Name of the file in benchmarks/baselines")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Slowdown that counts as a regression")
+    parser.add_argument("--raw", action="store_true", help="Compare timings without scaling by the calibration workload")
+    parser.add_argument("--moves-only", action="store_true", help="Report timings but fail only on changed moves")
+    args = parser.parse_args()
+    path = os.path.join(BASELINE_DIR, f"{args.baseline}.json")
+    if args.command == "compare" and not os.path.exists(path):
+        parser.error(f"no baseline at {path}; run save first")
+
+    results = run_suite()
+    if args.command == "run":
+        print_results(results)
+    elif args.command == "save":
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        results["machine"] = {"python": platform.python_version(), "platform": platform.platform(),
+                              "processor": platform.processor() or platform.machine()}
+        with open(path, "w") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+            f.write("\n")
+        print_results(results)
+        print(f"\nsaved {path}")
+    else:
+        with open(path) as f:
+            baseline = json.load(f)
+        failures = compare(baseline, results, args.threshold, args.raw, args.moves_only)
+        if failures:
+            print(f"\n{len(failures)} regression(s):\n  " + "\n  ".join(failures))
+            return 1
+        print("\nno regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+# Startup cost: import time of the game core and of the GUI module (best of N fresh
+# interpreters, from python -X importtime), and wall time from launching a process to
+# the first drawn frame of the menu window. The window part needs a display.
+# Usage: python benchmarks/bench_startup.py [runs]
+import statistics
+import subprocess
+import sys
+import time
+
+import _common # Puts the repo root on sys.path
+
+IMPORTS = ["tictactoe", "tictactoe.gui", "tkinter"]
+
+FIRST_WINDOW = """
+import sys, tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError:
+    sys.exit(3)
+from tictactoe.gui import TicTacToeGUI
+TicTacToeGUI(root)
+root.update() # Maps the window and draws the menu
+print("ready", flush=True)
+root.destroy()
+"""
+
+def import_times(module):
+    # {module: cumulative microseconds} for everything `import module` loads
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=_common.ROOT,
+                            capture_output=True, text=True).stderr
+    times = {}
+    for line in stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+def first_window_ms():
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", FIRST_WINDOW], cwd=_common.ROOT, capture_output=True, text=True)
+    if proc.returncode == 3: return None
+    if proc.returncode or "ready" not in proc.stdout: raise RuntimeError(proc.stderr)
+    return (time.perf_counter() - start) * 1000
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'import':<18}{'best ms':>9}{'median ms':>11}")
+    for module in IMPORTS:
+        samples = [import_times(module)[module] / 1000 for _ in range(runs)]
+        print(f"{module:<18}{min(samples):>9.1f}{statistics.median(samples):>11.1f}")
+    samples = [first_window_ms() for _ in range(runs)]
+    if None in samples:
+        print("\ntime to first window: skipped, no display")
+    else:
+        print(f"\ntime to first window: best {min(samples):.0f} ms, median {statistics.median(samples):.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# Transposition table sizing: hit rate, evictions and search time per capacity.
+# One MinimaxAI instance plays O for a series of games against a seeded random X,
+# so the numbers include reuse across moves and across games.
+# Usage: python benchmarks/bench_tt.py
+import random
+import time
+
+import _common # Puts the repo root on sys.path
+from tictactoe import MinimaxAI, TicTacToe
+
+# (size, difficulty, X's opening moves played before the AI's first search, games)
+SCENARIOS = [(4, "Medium", 1, 10), (4, "Hard", 4, 4), (5, "Medium", 2, 6)]
+CAPACITIES = [0, 1_000, 10_000, 100_000]
+
+def play_series(size, difficulty, opening, games, capacity):
+    ai = MinimaxAI(None, difficulty, tt_size=capacity)
+    rng = random.Random(1)
+    random.seed(1)
+    elapsed = 0.0
+    for _ in range(games):
+        game = TicTacToe(size)
+        ai.game = game
+        player = "X"
+        while not game.check_winner()[0] and not game.is_board_full():
+            if player == "X" or len(game.get_available_moves()) > size * size - opening:
+                move = rng.choice(game.get_available_moves())
+            else:
+                start = time.perf_counter()
+                move = ai.get_best_move()
+                elapsed += time.perf_counter() - start
+            game.make_move(*move, player)
+            player = "O" if player == "X" else "X"
+    return elapsed, ai.tt.stats()
+
+def main():
+    print(f"{'scenario':<16}{'capacity':>10}{'entries':>10}{'hit rate':>10}{'evictions':>11}{'time (s)':>10}")
+    for size, difficulty, opening, games in SCENARIOS:
+        label = f"{size}x{size} {difficulty}"
+        for capacity in CAPACITIES:
+            elapsed, stats = play_series(size, difficulty, opening, games, capacity)
+            print(f"{label:<16}{capacity:>10}{stats['entries']:>10}{stats['hit_rate']:>10.1%}"
+                  f"{stats['evictions']:>11}{elapsed:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+# Game core: importable without tkinter, so it also runs on display-less machines.
+from .ai import DIFFICULTY_DEPTHS, MinimaxAI, SearchCancelled, SearchTimeout
+from .board import BitboardTicTacToe, KInARowTicTacToe, TicTacToe
+from .evaluation import LineEvaluator
+from .mcts import MCTSAI
+from .ordering import MoveOrderer
+from .perfect_db import PERFECT_DB, PerfectPlayDB, build_perfect_play_db
+from .stats import SearchStats
+from .transposition import TranspositionTable, ZobristHasher
+
+__all__ = [
+    "BitboardTicTacToe", "DIFFICULTY_DEPTHS", "KInARowTicTacToe", "LineEvaluator", "MCTSAI", "MinimaxAI",
+    "MoveOrderer", "PERFECT_DB", "PerfectPlayDB", "SearchCancelled", "SearchStats", "SearchTimeout", "TicTacToe",
+    "TranspositionTable", "ZobristHasher", "build_perfect_play_db",
+]
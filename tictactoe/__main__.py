@@ -0,0 +1,26 @@
+# python -m tictactoe <command> [options]
+import importlib
+import sys
+
+COMMANDS = {
+    "gui": ("tictactoe.gui", "Open the game window"),
+    "selfplay": ("tictactoe.selfplay", "Run AI-vs-AI games and stream results as JSON Lines"),
+    "build-db": ("tictactoe.perfect_db", "Regenerate the 3x3 perfect-play database"),
+    "cache": ("tictactoe.position_cache", "Compact or inspect the on-disk position cache"),
+    "analyze": ("tictactoe.records", "Replay saved games and flag moves the AI would change"),
+    "serve": ("tictactoe.server", "Host games against the AI over TCP (JSON Lines)"),
+    "loadgen": ("tictactoe.loadgen", "Drive a running server with concurrent games"),
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print("usage: python -m tictactoe <command> [options]\n\ncommands:", file=sys.stderr)
+        for name, (_, summary) in COMMANDS.items():
+            print(f"  {name:<10} {summary}", file=sys.stderr)
+        return 2
+    module = importlib.import_module(COMMANDS[argv[0]][0])
+    return module.main(argv[1:])
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+import math
+import random
+import time
+
+from .evaluation import LineEvaluator
+from .ordering import MoveOrderer
+from .perfect_db import PERFECT_DB
+from .position_cache import HEURISTIC_FLAG, NO_MOVE, PositionCache, decode_move, encode_move, get_position_cache
+from .stats import SearchStats
+from .transposition import SIDE_TO_MOVE_KEY, TranspositionTable, ZobristHasher, get_zobrist_keys
+
+# --- AI Logic (MinimaxAI class) ---
+DIFFICULTY_DEPTHS = {"Medium": 4, "Hard": 8} # Adjusted for performance
+CACHE_MIN_NODES = 64 # Solved subtrees smaller than this are cheaper to search again than to log
+
+def win_length(game):
+    # Marks in a row needed to win: the whole side unless the game says otherwise
+    return getattr(game, "k", game.size)
+
+def warm_up(variants, position_cache=False):
+    # Builds the shared tables a first search would otherwise build on the clock: Zobrist
+    # keys, win lines, the perfect-play database mapping and, optionally, the position
+    # cache index. Safe to run on a background thread while the UI comes up.
+    PERFECT_DB.available()
+    for size, k in variants:
+        get_zobrist_keys(size)
+        LineEvaluator(size, k)
+        if position_cache: get_position_cache(size, k).refresh()
+
+class SearchTimeout(Exception):
+    pass
+
+class SearchCancelled(Exception):
+    pass
+
+class MinimaxAI:
+    # The table outlives a single search: keep one instance per game (or series of games)
+    def __init__(self, game, difficulty="Medium", tt_size=200_000, use_perfect_db=True, time_limit_ms=None, workers=1,
+                 move_ordering=True, search_depth=None, heuristic=True, position_cache=None):
+        self.game = game
+        self.difficulty = difficulty
+        self.search_depth = search_depth # Overrides the difficulty's fixed depth
+        self.move_ordering = move_ordering # True for MoveOrderer, False for row-major order, or an orderer object
+        self.orderer = None
+        self.heuristic = heuristic # Score horizon positions with LineEvaluator instead of as draws
+        self.evaluator = None
+        self.use_perfect_db = use_perfect_db
+        self.position_cache = position_cache # True for the shared on-disk cache of the board's variant, or a PositionCache
+        self.cache = None
+        self.time_limit_ms = time_limit_ms # Iterative deepening within this budget instead of a fixed depth
+        self.workers = workers # > 1 splits fixed-depth root moves across a process pool
+        self._executor = None
+        self.tt = TranspositionTable(tt_size)
+        self.hasher = None
+        self.max_depth = self.fixed_depth()
+        self._horizon_hits = 0
+        self._nodes = 0
+        self._leaves = 0
+        self._cutoffs = []
+        self._max_ply = 0
+        self._depth_completed = 0
+        self._cache_hits = 0
+        self._root_score = None
+        self._root_solved = False
+        self._deadline = None
+        self._cancel_event = None
+        self._pv_table = None # Best move per position from the previous deepening iteration
+        self.last_stats = None
+        self.listeners = [] # Called with the SearchStats of every get_best_move, on the searching thread
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def fixed_depth(self):
+        return self.search_depth or DIFFICULTY_DEPTHS.get(self.difficulty, 8)
+
+    def prepare(self, game):
+        # Per-search state that depends on the board size and win length
+        k = win_length(game)
+        if self.hasher is None or (self.hasher.size, self.hasher.k) != (game.size, k):
+            self.hasher = ZobristHasher(game.size, k) # The table is kept: keys differ per variant
+        self.hasher.reset(game)
+        if self.move_ordering is True:
+            if self.orderer is None or (self.orderer.size, self.orderer.k) != (game.size, k):
+                self.orderer = MoveOrderer(game.size, k=k)
+        else:
+            self.orderer = self.move_ordering or None
+        if self.orderer is not None: self.orderer.new_search()
+        if self.heuristic:
+            if self.evaluator is None or (self.evaluator.size, self.evaluator.k) != (game.size, k):
+                self.evaluator = LineEvaluator(game.size, k)
+            self.evaluator.reset(game)
+        else:
+            self.evaluator = None
+        if isinstance(self.position_cache, PositionCache):
+            self.cache = self.position_cache if (self.position_cache.size, self.position_cache.k) == (game.size, k) else None
+        else:
+            self.cache = get_position_cache(game.size, k) if self.position_cache else None
+        if self.cache is not None: self.cache.refresh()
+
+    def _play(self, game, row, col, player):
+        game.make_move(row, col, player)
+        self.hasher.toggle(row, col, player)
+        if self.evaluator is not None: self.evaluator.make(row, col, player)
+
+    def _unplay(self, game, row, col, player):
+        game.unmake_move(row, col)
+        self.hasher.toggle(row, col, player)
+        if self.evaluator is not None: self.evaluator.unmake(row, col, player)
+
+    def reset_counters(self, size):
+        self._nodes = self._leaves = self._max_ply = self._depth_completed = self._cache_hits = 0
+        self._cutoffs = [0] * (size * size + 1)
+
+    def get_best_move(self, game=None, cancel_event=None):
+        # Searches `game` (default self.game); returns None if cancel_event is set mid-search.
+        # What the search cost is left in self.last_stats and passed to every listener.
+        game = self.game if game is None else game
+        self.reset_counters(game.size)
+        tt_hits, tt_misses = self.tt.hits, self.tt.misses
+        start = time.perf_counter()
+        move, source = self.choose_move(game, cancel_event)
+        self.last_stats = SearchStats(
+            source, move, nodes=self._nodes, leaf_evaluations=self._leaves,
+            cutoffs_per_ply={ply: count for ply, count in enumerate(self._cutoffs) if count},
+            max_ply=self._max_ply, depth_completed=self._depth_completed,
+            tt_hits=self.tt.hits - tt_hits, tt_misses=self.tt.misses - tt_misses, cache_hits=self._cache_hits,
+            wall_time_ms=(time.perf_counter() - start) * 1000)
+        for listener in self.listeners:
+            listener(self.last_stats)
+        return move
+
+    def choose_move(self, game, cancel_event=None):
+        # (move, how it was chosen)
+        if self.difficulty == "Easy":
+            available_moves = game.get_available_moves()
+            return (random.choice(available_moves) if available_moves else None), "random"
+        elif self.difficulty == "Medium" and random.random() < 0.3:
+            available_moves = game.get_available_moves()
+            return (random.choice(available_moves) if available_moves else None), "random"
+
+        available_moves = game.get_available_moves()
+        if not available_moves: return None, "search"
+
+        standard_3x3 = game.size == 3 and win_length(game) == 3
+
+        # Opening book for standard 3x3
+        if len(available_moves) == game.size * game.size and standard_3x3:
+            center = (1, 1)
+            if center in available_moves: return center, "opening book"
+            corners = [(0,0), (0, 2), (2, 0), (2, 2)]
+            return random.choice(corners), "opening book"
+
+        # Solved 3x3 positions: sample among the optimal moves instead of searching
+        if self.use_perfect_db and standard_3x3:
+            scored = PERFECT_DB.move_values(game)
+            if scored:
+                best_value = max(value for _, value in scored)
+                return random.choice([move for move, value in scored if value == best_value]), "perfect db"
+
+        random.shuffle(available_moves)
+
+        self.prepare(game)
+        if self.orderer is not None: self.orderer.order(game, available_moves, 0, "O")
+        root_key, symmetry = self.hasher.key(True), self.hasher.symmetry()
+        if self.cache is not None:
+            cached = self.cache.lookup(root_key)
+            if cached is not None and cached[3] != NO_MOVE:
+                move = decode_move(game.size, symmetry, cached[3])
+                if move in available_moves:
+                    if self.reuses(cached): return move, "position cache"
+                    available_moves.remove(move)
+                    available_moves.insert(0, move) # Still a good first guess
+        heuristic = self.evaluator is not None
+
+        self._cancel_event = cancel_event
+        try:
+            if self.time_limit_ms is not None:
+                best_move, source = self.iterative_deepening(game, available_moves), "iterative deepening"
+            else:
+                self.max_depth = self.fixed_depth()
+                best_move, self._root_score = self.search_root(game, available_moves)
+                self._depth_completed = self.max_depth + 1
+                best_move, source = (best_move if best_move is not None else available_moves[0]), "search"
+        except SearchCancelled:
+            return None, "cancelled"
+        finally:
+            self._cancel_event = None
+        if self.cache is not None and self._depth_completed and self._root_score is not None:
+            depth = TranspositionTable.SOLVED if self._root_solved else self._depth_completed
+            self.cache.store(root_key, depth, self._root_score, TranspositionTable.EXACT,
+                             encode_move(game.size, symmetry, best_move), heuristic)
+        return best_move, source
+
+    def reuses(self, cached):
+        # A cached root result stands in for a search that would do exactly the same work:
+        # a solved position, or the same depth scored by the same evaluator
+        depth, _, flags, _ = cached
+        if flags & 3 != TranspositionTable.EXACT: return False
+        if depth == TranspositionTable.SOLVED: return True
+        return (self.time_limit_ms is None and depth == self.fixed_depth() + 1
+                and bool(flags & HEURISTIC_FLAG) == (self.evaluator is not None))
+
+    def iterative_deepening(self, game, available_moves):
+        # Deepen one ply at a time until the budget runs out; the previous iteration's
+        # best moves are searched first, and its root result is kept if time is up mid-iteration
+        self._deadline = time.perf_counter() + self.time_limit_ms / 1000
+        self._pv_table = {}
+        self._root_score = None
+        best_move = available_moves[0]
+        empty_cells = sum(row.count("") for row in game.board) # Can exceed the candidate moves on sparse boards
+        try:
+            for plies in range(1, empty_cells + 1):
+                self.max_depth = plies - 1
+                move, score = self.search_root(game, available_moves)
+                if move is None: break
+                best_move, self._root_score = move, score
+                self._depth_completed = plies
+                available_moves.remove(move)
+                available_moves.insert(0, move)
+                if score in (1, -1): break # Decided within the horizon, deeper plies won't change it
+        except SearchTimeout:
+            pass
+        finally:
+            self._deadline = None
+            self._pv_table = None
+        return best_move
+
+    def reset_tables(self):
+        # Forgets what earlier searches learned: the transposition table and the move-ordering history
+        self.tt.clear()
+        if self.move_ordering is True: self.orderer = None
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def search_root(self, game, available_moves):
+        if self.workers > 1 and self._deadline is None and len(available_moves) > 1:
+            return self.parallel_search_root(game, available_moves)
+
+        best_score = -math.inf
+        best_move = None
+        alpha = -math.inf
+        beta = math.inf
+        horizon_hits = self._horizon_hits
+
+        for move in available_moves:
+            row, col = move
+            self._play(game, row, col, "O")
+            try:
+                score = self.minimax_alpha_beta(game, 0, False, alpha, beta)
+            finally:
+                self._unplay(game, row, col, "O")
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, best_score)
+            if best_score == 1 and self.difficulty != "Easy": break # Optimization
+            if beta <= alpha: break
+
+        self._root_solved = self._horizon_hits == horizon_hits
+        return best_move, best_score
+
+    def parallel_search_root(self, game, available_moves):
+        # Young Brothers Wait at the root: the first move is searched here to get a bound,
+        # then its younger brothers are searched concurrently against that same bound.
+        # A move only beats the first one if it scores above the bound, in which case its
+        # score is exact, so picking the first best move in order matches the serial search.
+        # Each younger brother is searched from an empty table and this search's history, so
+        # its score doesn't depend on which worker ran it or what that worker ran before. A
+        # table kept from earlier searches can change the scores of equal moves either way,
+        # so the serial and parallel choices only agree when both start from reset_tables().
+        self._root_solved = False # Workers' horizon hits are not reported back
+        first_move = available_moves[0]
+        self._play(game, *first_move, "O")
+        try:
+            first_score = self.minimax_alpha_beta(game, 0, False, -math.inf, math.inf)
+        finally:
+            self._unplay(game, *first_move, "O")
+        if first_score == 1 and self.difficulty != "Easy": return first_move, first_score
+
+        # Imported on first use: concurrent.futures pulls in multiprocessing and logging,
+        # which is most of the package's import time
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        position = game.copy()
+        history = self.orderer.history if isinstance(self.orderer, MoveOrderer) else None
+        futures = {self._executor.submit(_search_root_move, position, self.difficulty, self.heuristic, history,
+                                           self.max_depth, move, first_score): move
+                   for move in available_moves[1:]}
+        scores = {first_move: first_score}
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in done:
+                    score, nodes, leaves = future.result()
+                    scores[futures[future]] = score
+                    self._nodes += nodes
+                    self._leaves += leaves
+                if self._cancel_event is not None and self._cancel_event.is_set(): raise SearchCancelled
+        finally:
+            for future in pending:
+                future.cancel()
+
+        best_move, best_score = first_move, first_score
+        for move in available_moves[1:]:
+            if scores[move] > best_score:
+                best_move, best_score = move, scores[move]
+        return best_move, best_score
+
+    def minimax_alpha_beta(self, game, depth, is_maximizing_player, alpha, beta):
+        self._nodes += 1
+        if not self._nodes & 255:
+            if self._cancel_event is not None and self._cancel_event.is_set(): raise SearchCancelled
+            if self._deadline is not None and time.perf_counter() > self._deadline: raise SearchTimeout
+
+        if depth >= self._max_ply: self._max_ply = depth + 1
+
+        winner, _, _ = game.check_winner()
+        if winner == "O": self._leaves += 1; return 1
+        if winner == "X": self._leaves += 1; return -1
+        if game.is_board_full(): self._leaves += 1; return 0
+
+        if depth >= self.max_depth and self.difficulty != "Easy":
+            self._horizon_hits += 1
+            self._leaves += 1
+            return self.evaluator.evaluate() if self.evaluator is not None else 0
+
+        alpha_orig, beta_orig = alpha, beta
+        remaining_depth = self.max_depth - depth
+        key = self.hasher.key(is_maximizing_player)
+        entry = self.tt.lookup(key, remaining_depth)
+        if entry is not None:
+            stored_depth, score, flag = entry
+            if stored_depth != TranspositionTable.SOLVED: self._horizon_hits += 1
+            if flag == TranspositionTable.EXACT: return score
+            if flag == TranspositionTable.LOWER: alpha = max(alpha, score)
+            else: beta = min(beta, score)
+            if beta <= alpha: return score
+        elif self.cache is not None:
+            cached = self.cache.lookup(key)
+            if cached is not None and cached[0] == TranspositionTable.SOLVED and cached[2] & 3 == TranspositionTable.EXACT:
+                self._cache_hits += 1
+                self.tt.store(key, TranspositionTable.SOLVED, cached[1], TranspositionTable.EXACT)
+                return cached[1]
+
+        horizon_hits_before = self._horizon_hits
+        nodes_before = self._nodes
+        moves = game.get_available_moves()
+        if self.orderer is not None:
+            self.orderer.order(game, moves, depth + 1, "O" if is_maximizing_player else "X")
+        if self._pv_table is not None:
+            # Keyed by the position as oriented on the board, since the stored move is not canonical
+            pv_key = self.hasher.hashes[0] ^ (SIDE_TO_MOVE_KEY if is_maximizing_player else 0)
+            pv_move = self._pv_table.get(pv_key)
+            if pv_move is not None:
+                moves.remove(pv_move)
+                moves.insert(0, pv_move)
+        best_move = None
+
+        if is_maximizing_player:
+            best_score = -math.inf
+            for r, c in moves:
+                self._play(game, r, c, "O")
+                try:
+                    score = self.minimax_alpha_beta(game, depth + 1, False, alpha, beta)
+                finally:
+                    self._unplay(game, r, c, "O")
+                if score > best_score: best_score, best_move = score, (r, c)
+                alpha = max(alpha, best_score)
+                if beta <= alpha:
+                    self._cutoffs[depth + 1] += 1
+                    if self.orderer is not None: self.orderer.record_cutoff((r, c), depth + 1, "O", remaining_depth)
+                    break
+        else: # Minimizing player
+            best_score = math.inf
+            for r, c in moves:
+                self._play(game, r, c, "X")
+                try:
+                    score = self.minimax_alpha_beta(game, depth + 1, True, alpha, beta)
+                finally:
+                    self._unplay(game, r, c, "X")
+                if score < best_score: best_score, best_move = score, (r, c)
+                beta = min(beta, best_score)
+                if beta <= alpha:
+                    self._cutoffs[depth + 1] += 1
+                    if self.orderer is not None: self.orderer.record_cutoff((r, c), depth + 1, "X", remaining_depth)
+                    break
+
+        if self._pv_table is not None: self._pv_table[pv_key] = best_move
+        if best_score <= alpha_orig: flag = TranspositionTable.UPPER
+        elif best_score >= beta_orig: flag = TranspositionTable.LOWER
+        else: flag = TranspositionTable.EXACT
+        solved = self._horizon_hits == horizon_hits_before
+        self.tt.store(key, TranspositionTable.SOLVED if solved else remaining_depth, best_score, flag)
+        if (solved and flag == TranspositionTable.EXACT and self.cache is not None
+                and self._nodes - nodes_before >= CACHE_MIN_NODES):
+            self.cache.store(key, TranspositionTable.SOLVED, best_score, TranspositionTable.EXACT)
+        return best_score
+
+# --- Parallel Root Search ---
+# Runs in pool processes; each process keeps one AI per configuration so the evaluator
+# and orderer are built once, but every root move starts from an empty table and the
+# parent's history (None when the parent doesn't use MoveOrderer).
+_WORKER_AIS = {}
+
+def _search_root_move(game, difficulty, heuristic, history, max_depth, move, alpha):
+    config = (difficulty, heuristic, history is not None)
+    ai = _WORKER_AIS.get(config)
+    if ai is None:
+        ai = _WORKER_AIS[config] = MinimaxAI(None, difficulty, heuristic=heuristic, move_ordering=history is not None)
+    ai.tt.clear()
+    ai.prepare(game)
+    if history is not None: ai.orderer.history = history
+    ai.reset_counters(game.size)
+    ai.max_depth = max_depth
+    ai._play(game, *move, "O")
+    return ai.minimax_alpha_beta(game, 0, False, alpha, math.inf), ai._nodes, ai._leaves
@@ -0,0 +1,263 @@
+# --- Game Logic (TicTacToe class: list-of-lists board with make/unmake and last-move win checks) ---
+class TicTacToe:
+    def __init__(self, size=3):
+        self.size = size
+        self.board = [["" for _ in range(size)] for _ in range(size)]
+        self.current_player = "X"
+
+    def make_move(self, row, col, player):
+        if 0 <= row < self.size and 0 <= col < self.size and self.board[row][col] == "":
+            self.board[row][col] = player
+            return True
+        return False
+
+    def unmake_move(self, row, col):
+        self.board[row][col] = ""
+
+    def get_available_moves(self):
+        return [(r, c) for r in range(self.size) for c in range(self.size) if self.board[r][c] == ""]
+
+    def check_winner(self):
+        n = self.size
+        # Check rows
+        for r in range(n):
+            if self.board[r][0] != "" and all(self.board[r][c] == self.board[r][0] for c in range(n)):
+                return self.board[r][0], "row", r
+        # Check columns
+        for c in range(n):
+            if self.board[0][c] != "" and all(self.board[r][c] == self.board[0][c] for r in range(n)):
+                return self.board[0][c], "col", c
+        # Check diagonals
+        if n > 0 and self.board[0][0] != "" and all(self.board[i][i] == self.board[0][0] for i in range(n)):
+            return self.board[0][0], "diag", 0
+        if n > 0 and self.board[0][n - 1] != "" and all(self.board[i][n - 1 - i] == self.board[0][n - 1] for i in range(n)):
+            return self.board[0][n - 1], "diag", 1
+        return None, None, None
+
+    def is_winning_move(self, row, col, player):
+        # Would `player` complete a line by taking the empty cell (row, col)?
+        n, board = self.size, self.board
+        if all(board[row][c] == player for c in range(n) if c != col): return True
+        if all(board[r][col] == player for r in range(n) if r != row): return True
+        if row == col and all(board[i][i] == player for i in range(n) if i != row): return True
+        if row + col == n - 1 and all(board[i][n - 1 - i] == player for i in range(n) if i != row): return True
+        return False
+
+    def is_board_full(self):
+        return not any("" in row for row in self.board)
+
+    def copy(self):
+        new_game = TicTacToe(self.size)
+        new_game.board = [row[:] for row in self.board]
+        new_game.current_player = self.current_player
+        return new_game
+
+# --- Bitboard Backend ---
+# Cell (r, c) lives at bit r * size + c. Each winning line is a mask tagged with the
+# same (line_type, line_index) pair check_winner reports, so the GUI can highlight it.
+def _build_win_lines(n):
+    lines = []
+    for r in range(n):
+        lines.append((sum(1 << (r * n + c) for c in range(n)), "row", r))
+    for c in range(n):
+        lines.append((sum(1 << (r * n + c) for r in range(n)), "col", c))
+    lines.append((sum(1 << (i * n + i) for i in range(n)), "diag", 0))
+    lines.append((sum(1 << (i * n + n - 1 - i) for i in range(n)), "diag", 1))
+    return lines
+
+def _build_cell_lines(n, lines):
+    return [tuple(line for line in lines if line[0] >> bit & 1) for bit in range(n * n)]
+
+WIN_LINES = {n: _build_win_lines(n) for n in (3, 4, 5)}
+CELL_LINES = {n: _build_cell_lines(n, lines) for n, lines in WIN_LINES.items()}
+
+def get_cell_lines(n):
+    if n not in CELL_LINES:
+        WIN_LINES[n] = _build_win_lines(n)
+        CELL_LINES[n] = _build_cell_lines(n, WIN_LINES[n])
+    return CELL_LINES[n]
+
+class BitboardTicTacToe:
+    def __init__(self, size=3):
+        self.size = size
+        self.x_bits = 0
+        self.o_bits = 0
+        self.full_mask = (1 << (size * size)) - 1
+        self.cell_lines = get_cell_lines(size)
+        self.moves = [] # Stack of bit indices, the last one drives check_winner
+        self.current_player = "X"
+
+    @classmethod
+    def from_game(cls, game):
+        new_game = cls(game.size)
+        for r, row in enumerate(game.board):
+            for c, cell in enumerate(row):
+                if cell: new_game.make_move(r, c, cell)
+        new_game.current_player = game.current_player
+        return new_game
+
+    @property
+    def board(self):
+        n = self.size
+        return [["X" if self.x_bits >> (r * n + c) & 1 else "O" if self.o_bits >> (r * n + c) & 1 else ""
+                 for c in range(n)] for r in range(n)]
+
+    def make_move(self, row, col, player):
+        if not (0 <= row < self.size and 0 <= col < self.size): return False
+        bit = row * self.size + col
+        if (self.x_bits | self.o_bits) >> bit & 1: return False
+        if player == "X": self.x_bits |= 1 << bit
+        else: self.o_bits |= 1 << bit
+        self.moves.append(bit)
+        return True
+
+    def undo_move(self, row, col):
+        bit = row * self.size + col
+        mask = ~(1 << bit)
+        self.x_bits &= mask
+        self.o_bits &= mask
+        if self.moves and self.moves[-1] == bit: self.moves.pop()
+        elif bit in self.moves: self.moves.remove(bit)
+
+    unmake_move = undo_move
+
+    def get_available_moves(self):
+        n = self.size
+        occupied = self.x_bits | self.o_bits
+        return [divmod(bit, n) for bit in range(n * n) if not occupied >> bit & 1]
+
+    def check_winner(self):
+        # Any earlier win would have ended the game, so only lines through the last move can be new
+        if not self.moves: return None, None, None
+        bit = self.moves[-1]
+        if self.x_bits >> bit & 1: player, bits = "X", self.x_bits
+        else: player, bits = "O", self.o_bits
+        for mask, line_type, line_index in self.cell_lines[bit]:
+            if bits & mask == mask:
+                return player, line_type, line_index
+        return None, None, None
+
+    def is_winning_move(self, row, col, player):
+        bit = row * self.size + col
+        bits = (self.x_bits if player == "X" else self.o_bits) | 1 << bit
+        return any(bits & mask == mask for mask, _, _ in self.cell_lines[bit])
+
+    def is_board_full(self):
+        return self.x_bits | self.o_bits == self.full_mask
+
+    def copy(self):
+        new_game = BitboardTicTacToe(self.size)
+        new_game.x_bits = self.x_bits
+        new_game.o_bits = self.o_bits
+        new_game.moves = self.moves[:]
+        new_game.current_player = self.current_player
+        return new_game
+
+# --- k-in-a-row ---
+# Bigger boards are won by k marks in a row anywhere: 7x7 four-in-a-row, 15x15 gomoku.
+# Only the four directions through the last move can hold a new win, and the search
+# only considers empty cells within `radius` of a mark, so neither cost grows with the
+# board. check_winner reports the winning run as ("cells", ((r, c), ...)).
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+WINDOWS = {} # (n, k) -> [(mask, cells)] for every run of k cells
+
+def get_windows(n, k):
+    if (n, k) not in WINDOWS:
+        windows = []
+        for r in range(n):
+            for c in range(n):
+                for dr, dc in DIRECTIONS:
+                    if 0 <= r + (k - 1) * dr < n and 0 <= c + (k - 1) * dc < n:
+                        cells = tuple((r + i * dr, c + i * dc) for i in range(k))
+                        windows.append((sum(1 << (cr * n + cc) for cr, cc in cells), cells))
+        WINDOWS[n, k] = windows
+    return WINDOWS[n, k]
+
+class KInARowTicTacToe(BitboardTicTacToe):
+    def __init__(self, size=15, k=5, radius=2):
+        if not 3 <= k <= size: raise ValueError(f"k must be between 3 and the board size, got {k}")
+        super().__init__(size)
+        self.k = k
+        self.radius = radius # Candidate moves are empty cells at most this far from a mark
+        first_col = sum(1 << (r * size) for r in range(size))
+        self.not_first_col = self.full_mask & ~first_col
+        self.not_last_col = self.full_mask & ~(first_col << (size - 1))
+
+    def _run(self, bits, row, col, dr, dc):
+        # Marks in `bits` next to (row, col), walking in one direction
+        n, count = self.size, 0
+        row, col = row + dr, col + dc
+        while 0 <= row < n and 0 <= col < n and bits >> (row * n + col) & 1:
+            count += 1
+            row, col = row + dr, col + dc
+        return count
+
+    def _shift(self, bits, dr, dc):
+        # Every cell of `bits` moved one step by (dr, dc), dropping what falls off the board
+        step = dr * self.size + dc
+        bits = bits << step if step > 0 else bits >> -step
+        if dc == 1: bits &= self.not_first_col
+        elif dc == -1: bits &= self.not_last_col
+        return bits & self.full_mask
+
+    def winning_cells(self, player):
+        # Mask of every empty cell that would give `player` k in a row, all directions at once:
+        # a cell wins if it has `a` marks behind it and k - 1 - a ahead in the same direction
+        bits = self.x_bits if player == "X" else self.o_bits
+        k = self.k
+        cells = 0
+        for dr, dc in DIRECTIONS:
+            ahead, behind = [self.full_mask], [self.full_mask] # [j]: cells with j marks in a row that way
+            moved_ahead = moved_behind = bits
+            for _ in range(k - 1):
+                moved_ahead = self._shift(moved_ahead, -dr, -dc)
+                moved_behind = self._shift(moved_behind, dr, dc)
+                ahead.append(ahead[-1] & moved_ahead)
+                behind.append(behind[-1] & moved_behind)
+            for a in range(k):
+                cells |= behind[a] & ahead[k - 1 - a]
+        return cells & ~(self.x_bits | self.o_bits) & self.full_mask
+
+    def get_available_moves(self):
+        n = self.size
+        occupied = self.x_bits | self.o_bits
+        if not occupied: return [(n // 2, n // 2)]
+        near = occupied
+        for _ in range(self.radius):
+            near |= (near << 1 & self.not_first_col) | (near >> 1 & self.not_last_col)
+            near |= near << n | near >> n
+        near &= self.full_mask & ~occupied
+        moves = []
+        while near:
+            low = near & -near
+            moves.append(divmod(low.bit_length() - 1, n))
+            near ^= low
+        return moves
+
+    def check_winner(self):
+        if not self.moves: return None, None, None
+        bit = self.moves[-1]
+        if self.x_bits >> bit & 1: player, bits = "X", self.x_bits
+        else: player, bits = "O", self.o_bits
+        row, col = divmod(bit, self.size)
+        for dr, dc in DIRECTIONS:
+            ahead, behind = self._run(bits, row, col, dr, dc), self._run(bits, row, col, -dr, -dc)
+            if ahead + behind + 1 >= self.k:
+                return player, "cells", tuple((row + i * dr, col + i * dc) for i in range(-behind, ahead + 1))
+        return None, None, None
+
+    def is_winning_move(self, row, col, player):
+        bits = self.x_bits if player == "X" else self.o_bits
+        k = self.k - 1
+        for dr, dc in DIRECTIONS:
+            if self._run(bits, row, col, dr, dc) + self._run(bits, row, col, -dr, -dc) >= k: return True
+        return False
+
+    def copy(self):
+        new_game = KInARowTicTacToe(self.size, self.k, self.radius)
+        new_game.x_bits = self.x_bits
+        new_game.o_bits = self.o_bits
+        new_game.moves = self.moves[:]
+        new_game.current_player = self.current_player
+        return new_game
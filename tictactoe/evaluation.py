@@ -0,0 +1,67 @@
+# --- Static Evaluation ---
+# Scores a position by its open lines: a line holding only O marks is worth
+# line_weights(k)[count] to O, one holding only X marks the same to X, and a line with
+# both is dead. Mark counts per line are kept up to date on every make/unmake, so
+# scoring a leaf costs one division. The running total is an integer, so make/unmake
+# pairs restore it exactly. Scores stay strictly inside (-0.5, 0.5), so any forced
+# win (+-1) still outranks every heuristic score.
+from .board import WIN_LINES, get_cell_lines, get_windows
+
+LINE_WEIGHT_BASE = 8 # Each extra mark on an open line is worth this many lines with one fewer
+
+def line_weights(k):
+    # Indexed by the number of marks on the line: 0, 1, 8, 64, ... for up to k - 1 marks, and
+    # 0 for a full line, which is a win the search scores itself
+    return (0,) + tuple(LINE_WEIGHT_BASE ** (count - 1) for count in range(1, k)) + (0,)
+
+class LineEvaluator:
+    def __init__(self, size, k=None):
+        self.size = size
+        self.k = k = k or size # Marks in a row needed to win; every run of k cells is a line
+        if k == size:
+            get_cell_lines(size) # Builds WIN_LINES for sizes beyond the precomputed ones
+            self.masks = [mask for mask, _, _ in WIN_LINES[size]]
+        else:
+            self.masks = [mask for mask, _ in get_windows(size, k)]
+        self.cell_lines = [[i for i, mask in enumerate(self.masks) if mask >> bit & 1] for bit in range(size * size)]
+        weights = line_weights(k)
+        self.scale = 2 * len(self.masks) * max(weights) + 1
+        # value[x][o]: contribution of a line holding x X marks and o O marks, from O's point of view
+        self.value = [[weights[o] if not x else -weights[x] if not o else 0 for o in range(k + 1)]
+                      for x in range(k + 1)]
+        self.x_counts = [0] * len(self.masks)
+        self.o_counts = [0] * len(self.masks)
+        self.total = 0
+
+    def evaluate(self):
+        return self.total / self.scale
+
+    def reset(self, game):
+        # Counts from scratch with popcounts over each line's mask
+        n = self.size
+        x_bits = o_bits = 0
+        for r, row in enumerate(game.board):
+            for c, cell in enumerate(row):
+                if cell == "X": x_bits |= 1 << (r * n + c)
+                elif cell == "O": o_bits |= 1 << (r * n + c)
+        self.x_counts = [(x_bits & mask).bit_count() for mask in self.masks]
+        self.o_counts = [(o_bits & mask).bit_count() for mask in self.masks]
+        self.total = sum(self.value[x][o] for x, o in zip(self.x_counts, self.o_counts))
+
+    def make(self, row, col, player):
+        value, x_counts, o_counts = self.value, self.x_counts, self.o_counts
+        delta = 0
+        for i in self.cell_lines[row * self.size + col]:
+            x, o = x_counts[i], o_counts[i]
+            if player == "X": x_counts[i] = x + 1; delta += value[x + 1][o] - value[x][o]
+            else: o_counts[i] = o + 1; delta += value[x][o + 1] - value[x][o]
+        self.total += delta
+
+    def unmake(self, row, col, player):
+        value, x_counts, o_counts = self.value, self.x_counts, self.o_counts
+        delta = 0
+        for i in self.cell_lines[row * self.size + col]:
+            x, o = x_counts[i], o_counts[i]
+            if player == "X": x_counts[i] = x - 1; delta += value[x - 1][o] - value[x][o]
+            else: o_counts[i] = o - 1; delta += value[x][o - 1] - value[x][o]
+        self.total += delta
@@ -0,0 +1,83 @@
+# Saved games: the on-disk format, save_game for the GUI and read_games for the analyzer.
+# Kept free of the AI and command-line modules so the GUI can import it cheaply.
+import os
+import struct
+
+try:
+    import fcntl # Keeps appends from several processes whole; not on Windows
+except ImportError:
+    fcntl = None
+
+# --- Game Records ---
+# Finished games in an append-only binary log: an 8-byte file header, then per game a
+# 4-byte header (board size, k, flags, move count) and one byte per move holding the
+# cell index row * size + col. A 3x3 game takes at most 13 bytes and a 15x15 one 229.
+# Moves alternate, so the flags only need who moved first and how the game ended.
+GAMES_PATH = os.environ.get("TICTACTOE_GAMES") or os.path.join(os.path.expanduser("~"), ".local", "share", "tictactoe", "games.log")
+GAMES_MAGIC = b"TTGR"
+GAMES_VERSION = 1
+FILE_HEADER = 8 # magic, version, 3 reserved
+GAME_HEADER = struct.Struct("<BBBB") # size, k, flags, move count
+O_FIRST = 1 # Flag bit; bits 1-2 hold the result
+RESULTS = (None, "X", "O", "draw") # None: abandoned before the end
+READ_CHUNK = 1 << 20
+
+# [O_FIRST flag][size][ply parity][cell] -> (row, col, player), so decoding a move is two
+# lookups; built on the first read, since the GUI only ever appends
+_MOVES = []
+
+def _move_tables():
+    if not _MOVES:
+        _MOVES.extend({size: [[(cell // size, cell % size, player) for cell in range(size * size)] for player in order]
+                       for size in range(3, 16)} for order in (("X", "O"), ("O", "X")))
+    return _MOVES
+
+def encode_game(size, k, moves, result):
+    # moves: (row, col, player) in order, as in TicTacToeGUI.move_history
+    if not 3 <= (k or size) <= size <= 15: raise ValueError(f"can't record a {size}x{size} k={k} game")
+    if len(moves) > size * size: raise ValueError("more moves than cells")
+    for (_, _, player), (_, _, next_player) in zip(moves, moves[1:]):
+        if player == next_player: raise ValueError("moves must alternate between X and O")
+    flags = (O_FIRST if moves and moves[0][2] == "O" else 0) | RESULTS.index(result) << 1
+    return GAME_HEADER.pack(size, k or size, flags, len(moves)) + bytes(r * size + c for r, c, _ in moves)
+
+def save_game(size, k, moves, result, path=None):
+    # Appends one game with a single write, so concurrent writers never interleave records
+    path = path or GAMES_PATH
+    data = encode_game(size, k, moves, result)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None: fcntl.flock(fd, fcntl.LOCK_EX)
+        if os.fstat(fd).st_size == 0:
+            data = GAMES_MAGIC + bytes([GAMES_VERSION, 0, 0, 0]) + data
+        os.write(fd, data)
+    finally:
+        os.close(fd) # Also releases the lock
+
+def read_games(path=None):
+    # Yields (size, k, moves, result) per game without holding more than one chunk of the
+    # log in memory; moves are (row, col, player). A torn last record is skipped.
+    path = path or GAMES_PATH
+    with open(path, "rb") as f:
+        header = f.read(FILE_HEADER)
+        if header[:4] != GAMES_MAGIC or len(header) < FILE_HEADER: raise ValueError(f"{path} is not a game log")
+        if header[4] != GAMES_VERSION: raise ValueError(f"{path} has unsupported version {header[4]}")
+        tables = _move_tables()
+        buffer, pos, offset = b"", 0, FILE_HEADER
+        while True:
+            if len(buffer) - pos < GAME_HEADER.size + 225: # Room for the largest game
+                chunk = f.read(READ_CHUNK)
+                buffer = buffer[pos:] + chunk
+                offset += pos
+                pos = 0
+            if len(buffer) - pos < GAME_HEADER.size: return
+            size, k, flags, count = GAME_HEADER.unpack_from(buffer, pos)
+            if not 3 <= k <= size <= 15 or count > size * size or flags >> 3:
+                raise ValueError(f"{path}: corrupt record at byte {offset + pos}")
+            start = pos + GAME_HEADER.size
+            cells = buffer[start:start + count]
+            if len(cells) < count: return
+            pos = start + count
+            moves = tables[flags & O_FIRST][size]
+            yield size, k, [moves[ply & 1][cell] for ply, cell in enumerate(cells)], RESULTS[flags >> 1]
@@ -0,0 +1,598 @@
+# The Tk front end: python "AI Game.py" or python -m tictactoe gui. Nothing else in the
+# package imports this module, so the game core stays usable without tkinter.
+import tkinter as tk
+from tkinter import ttk
+import queue
+import random
+import threading
+import time
+
+from .ai import MinimaxAI, warm_up
+from .board import KInARowTicTacToe, TicTacToe
+from .gamelog import save_game
+
+# --- Constants for Styling ---
+BG_COLOR = "#2E3440"
+FG_COLOR = "#ECEFF4"
+BUTTON_COLOR = "#434C5E"
+BUTTON_HOVER_COLOR = "#5E81AC"
+BUTTON_TEXT_COLOR = "#ECEFF4"
+X_COLOR = "#BF616A"
+O_COLOR = "#A3BE8C"
+WIN_HIGHLIGHT_COLOR = "#EBCB8B"
+WIN_FLASH_COLOR = "#D08770"
+DEFAULT_FONT = ('Arial', 24, 'bold')
+SMALL_GAME_FONT = ('Arial', 12, 'bold') # Boards too big for DEFAULT_FONT
+STATUS_FONT = ('Arial', 16)
+TITLE_FONT = ('Arial', 28, 'bold')
+BUTTON_FONT = ('Arial', 14)
+DEBUG_FONT = ('Courier', 10)
+
+# --- AI Settings ---
+AI_TIME_BUDGET_MS = {"Medium": 300, "Hard": 1000} # Per move on 4x4 and 5x5 boards
+LARGE_BOARD_TIME_BUDGET_MS = {"Medium": 300, "Hard": 800} # k-in-a-row boards, leaving room to reply within a second
+AI_POLL_MS = 30 # How often the Tk loop checks for a finished AI search
+
+# --- Board Variants ---
+BOARD_VARIANTS = [(3, 3), (4, 4), (5, 5), (7, 4), (15, 5)] # (size, marks in a row to win)
+
+def variant_label(size, k):
+    return f"{size}x{size}" if k == size else f"{size}x{size} · {k} in a row"
+
+# --- Background AI Worker ---
+# Searches run on one daemon thread, in submission order, so an AI's tables are never
+# touched by two searches at once. The search yields the GIL every few milliseconds,
+# which keeps the Tk loop drawing; a thread rather than a process keeps the
+# transposition table warm between moves and makes cancellation a shared Event.
+class AIWorker:
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.results = queue.Queue() # (token, move, SearchStats, error), polled from the Tk thread
+        self._cancel_event = None
+        self._thread = threading.Thread(target=self._run, name="ai-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, token, ai, game):
+        # Any search still running is for an older position
+        self.cancel()
+        self._cancel_event = threading.Event()
+        self.jobs.put((token, ai, game.copy(), self._cancel_event))
+
+    def cancel(self):
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    def _run(self):
+        while True:
+            token, ai, game, cancel_event = self.jobs.get()
+            if cancel_event.is_set(): continue
+            try:
+                move, stats, error = ai.get_best_move(game, cancel_event), ai.last_stats, None
+            except Exception as exc: # Handed to the Tk thread; last_stats would be the previous search's
+                move, stats, error = None, None, exc
+            if not cancel_event.is_set():
+                self.results.put((token, move, stats, error))
+
+# --- Widget Enhancements ---
+class AnimatedButton(ttk.Button):
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.default_bg = BUTTON_COLOR
+        self.hover_bg = BUTTON_HOVER_COLOR
+
+        self.bind("<Enter>", self.on_enter)
+        self.bind("<Leave>", self.on_leave)
+
+    def on_enter(self, e):
+        self.config(style="Hover.TButton")
+
+    def on_leave(self, e):
+        self.config(style="TButton")
+
+# --- Main GUI Class ---
+class TicTacToeGUI:
+    def __init__(self, master):
+        self.master = master
+        master.title("Tic-Tac-Toe")
+        master.configure(bg=BG_COLOR)
+        master.geometry("700x800")
+        master.minsize(600, 700)
+        
+        master.grid_rowconfigure(0, weight=1)
+        master.grid_columnconfigure(0, weight=1)
+
+        self.game_mode = None
+        self.board_size = None
+        self.win_length = None
+        self.ai_difficulty = None
+        self.game = None
+        self.ai = None
+        self.buttons = []
+        self.game_frame = None # The game screen, kept across games and hidden while a menu shows
+        self.rendered = [] # [row][col] -> (text, style, state) each board button currently shows
+        self.flash_after_id = None
+        self.reset_started = None # perf_counter() when the last start_game began
+        self.reset_ms = None # Time from start_game until the board was drawn and idle
+        self.current_player = "X"
+        self.game_over = False
+        self.who_starts_next = "X" 
+        self.who_starts_round = "X"
+        self.move_history = []
+        self.ai_worker = AIWorker()
+        self.ai_token = 0 # Identifies the search whose result may still be applied
+        self.ai_pending = None
+        self.ai_after_id = None
+        self.show_search_stats = False # F3 toggles the search cost overlay under the status line
+        self.debug_label = None
+        master.bind("<F3>", self.toggle_search_stats)
+        
+        self.configure_styles()
+
+        self.main_frame = None
+        self.create_menu()
+        master.after_idle(self.start_warm_up) # Once the menu has been drawn
+
+    def start_warm_up(self):
+        # The AI's shared tables are built off the Tk thread, so the first move doesn't pay for them
+        threading.Thread(target=warm_up, args=(BOARD_VARIANTS, True), name="ai-warm-up", daemon=True).start()
+
+    def configure_styles(self):
+        # Only what the menus need; board styles are added by game_style on first use
+        self.style = ttk.Style()
+        self.game_styles = set()
+        self.style.theme_use('clam')
+        
+        self.style.configure(".", background=BG_COLOR, foreground=FG_COLOR, borderwidth=0, focusthickness=0)
+        self.style.layout('TButton', [('Button.padding', {'sticky': 'nswe', 'children': [('Button.label', {'sticky': 'nswe'})]})])
+
+        self.style.configure("TFrame", background=BG_COLOR)
+        self.style.configure("TLabel", padding=10, font=STATUS_FONT, anchor="center", background=BG_COLOR)
+        self.style.configure("Title.TLabel", font=TITLE_FONT, padding=(10, 20), foreground=FG_COLOR)
+        self.style.configure("Status.TLabel", font=STATUS_FONT, padding=(10, 10))
+        self.style.configure("Debug.TLabel", font=DEBUG_FONT, padding=(10, 0), foreground=BUTTON_HOVER_COLOR)
+
+        self.style.configure("TButton", background=BUTTON_COLOR, foreground=BUTTON_TEXT_COLOR, relief="flat", padding=10, font=BUTTON_FONT)
+        self.style.map("TButton", background=[('active', BUTTON_HOVER_COLOR)])
+        self.style.configure("Hover.TButton", background=BUTTON_HOVER_COLOR)
+
+    def game_style(self, name):
+        # "Game.TButton", "X.Game.TButton", "O.Win.Game.TButton", ...: configured the first time a cell uses one
+        if name in self.game_styles: return
+        self.game_styles.add(name)
+        if name == "Game.TButton":
+            self.style.configure(name, font=DEFAULT_FONT, padding=5, width=3, background=BUTTON_COLOR)
+            self.style.map(name, background=[('active', BUTTON_COLOR), ('disabled', BUTTON_COLOR)])
+            return
+        player, variant = name.split(".")[:2]
+        color = X_COLOR if player == "X" else O_COLOR
+        background = {"Win": WIN_HIGHLIGHT_COLOR, "Flash": WIN_FLASH_COLOR}.get(variant)
+        if background is None:
+            self.style.configure(name, foreground=color)
+            self.style.map(name, foreground=[('disabled', color)])
+        else:
+            self.style.configure(name, background=background, foreground=color)
+            self.style.map(name, background=[('disabled', background)], foreground=[('disabled', color)])
+
+    def clear_screen(self):
+        # Menus are rebuilt every time; the game screen is only hidden, so the next game reuses it
+        if self.main_frame:
+            self.main_frame.destroy()
+        if self.game_frame is not None:
+            self.game_frame.grid_remove()
+        self.main_frame = ttk.Frame(self.master, style="TFrame")
+        self.main_frame.grid(row=0, column=0, sticky="nsew")
+
+    def show_game_screen(self):
+        if self.main_frame:
+            self.main_frame.destroy()
+            self.main_frame = None
+        if self.game_frame is None or len(self.buttons) != self.board_size:
+            self.create_board_gui()
+        self.game_frame.grid()
+
+    def create_menu(self):
+        self.cancel_ai()
+        self.cancel_flash()
+        self.clear_screen()
+        self.game_over = False
+        self.who_starts_next = "X"
+        
+        menu_container = ttk.Frame(self.main_frame, style="TFrame")
+        menu_container.pack(expand=True)
+
+        ttk.Label(menu_container, text="Tic-Tac-Toe", style="Title.TLabel").pack(pady=(20, 30))
+        ttk.Label(menu_container, text="Select Game Mode:", style="TLabel").pack(pady=10)
+        
+        AnimatedButton(menu_container, text="Play Against AI", command=self.select_difficulty, width=25).pack(pady=8)
+        AnimatedButton(menu_container, text="Two Player", command=self.select_multiplayer_size, width=25).pack(pady=8)
+    
+    def select_difficulty(self):
+        self.game_mode = "AI"
+        self.clear_screen()
+        
+        diff_container = ttk.Frame(self.main_frame, style="TFrame")
+        diff_container.pack(expand=True)
+
+        ttk.Label(diff_container, text="Select AI Difficulty", style="Title.TLabel").pack(pady=(20, 30))
+        AnimatedButton(diff_container, text="Easy", command=lambda: self.select_ai_size("Easy"), width=20).pack(pady=8)
+        AnimatedButton(diff_container, text="Medium", command=lambda: self.select_ai_size("Medium"), width=20).pack(pady=8)
+        AnimatedButton(diff_container, text="Hard", command=lambda: self.select_ai_size("Hard"), width=20).pack(pady=8)
+        AnimatedButton(diff_container, text="Back", command=self.create_menu, width=20).pack(pady=20)
+
+    def select_ai_size(self, difficulty):
+        self.clear_screen()
+
+        size_container = ttk.Frame(self.main_frame, style="TFrame")
+        size_container.pack(expand=True)
+
+        ttk.Label(size_container, text="Select Board Size", style="Title.TLabel").pack(pady=(20, 30))
+        for size, k in BOARD_VARIANTS:
+            AnimatedButton(size_container, text=variant_label(size, k),
+                           command=lambda size=size, k=k: self.start_ai_game(difficulty, size, k), width=20).pack(pady=8)
+        AnimatedButton(size_container, text="Back", command=self.select_difficulty, width=20).pack(pady=20)
+
+    def select_multiplayer_size(self):
+        self.game_mode = "Multiplayer"
+        self.clear_screen()
+        
+        size_container = ttk.Frame(self.main_frame, style="TFrame")
+        size_container.pack(expand=True)
+
+        ttk.Label(size_container, text="Select Board Size", style="Title.TLabel").pack(pady=(20, 30))
+        for size, k in BOARD_VARIANTS:
+            AnimatedButton(size_container, text=variant_label(size, k),
+                           command=lambda size=size, k=k: self.start_multiplayer_game(size, k), width=20).pack(pady=8)
+        AnimatedButton(size_container, text="Back", command=self.create_menu, width=20).pack(pady=20)
+
+    def start_multiplayer_game(self, size, k=None):
+        self.board_size = size
+        self.win_length = k or size
+        self.ai_difficulty = None
+        self.game_mode = "Multiplayer"
+        self.who_starts_next = "X"
+        self.start_game()
+
+    def start_ai_game(self, difficulty, size=3, k=None):
+        self.game_mode = "AI"
+        self.board_size = size
+        self.win_length = k or size
+        self.ai_difficulty = difficulty
+        self.start_game()
+
+    def start_game(self, keep_starter=False):
+        self.reset_started = time.perf_counter()
+        self.cancel_ai()
+        self.cancel_flash()
+        self.move_history.clear()
+        
+        if self.game_mode == "AI":
+            if not keep_starter:
+                self.who_starts_round = self.who_starts_next
+                self.who_starts_next = "O" if self.who_starts_round == "X" else "X"
+        else:
+            self.who_starts_round = "X"
+            
+        self.current_player = self.who_starts_round
+        if self.win_length == self.board_size:
+            self.game = TicTacToe(size=self.board_size)
+        else:
+            self.game = KInARowTicTacToe(self.board_size, self.win_length)
+        self.game.current_player = self.current_player
+        if self.game_mode == "AI":
+            # Fixed-depth search is too slow beyond 3x3, so larger boards search against the clock
+            budgets = AI_TIME_BUDGET_MS if self.win_length == self.board_size else LARGE_BOARD_TIME_BUDGET_MS
+            time_limit_ms = budgets.get(self.ai_difficulty) if self.board_size > 3 else None
+            # Reuse the AI so its transposition table carries over between games
+            if self.ai is None or self.ai.difficulty != self.ai_difficulty or self.ai.time_limit_ms != time_limit_ms:
+                self.ai = MinimaxAI(self.game, self.ai_difficulty, time_limit_ms=time_limit_ms, position_cache=True)
+            else:
+                self.ai.game = self.game
+        self.game_over = False
+
+        self.show_game_screen()
+        self.sync_board()
+        self.endgame_control_frame.pack_forget()
+        self.ingame_control_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 20), padx=20)
+        self.undo_button.config(state=tk.DISABLED)
+        self.update_status_label()
+        self.master.after_idle(self.record_reset_time) # Runs after the redraws queued above
+
+        if self.game_mode == "AI" and self.current_player == "O":
+            self.ai_after_id = self.master.after(500, self.ai_move)
+
+    def reset_game(self):
+        self.start_game(keep_starter=True)
+
+    def record_reset_time(self):
+        self.reset_ms = (time.perf_counter() - self.reset_started) * 1000
+        self.update_search_stats(self.ai.last_stats if self.ai and self.game_mode == "AI" else None)
+
+    def create_board_gui(self):
+        # Built once per board size; later games only repaint the cells that changed
+        if self.game_frame is not None:
+            self.game_frame.destroy()
+        self.game_frame = ttk.Frame(self.master, style="TFrame")
+        self.game_frame.grid(row=0, column=0, sticky="nsew")
+
+        self.status_label = ttk.Label(self.game_frame, style="Status.TLabel")
+        self.status_label.pack(side=tk.TOP, pady=(20, 10), fill=tk.X)
+        self.debug_label = ttk.Label(self.game_frame, style="Debug.TLabel", justify=tk.CENTER)
+        if self.show_search_stats:
+            self.debug_label.pack(side=tk.TOP, fill=tk.X)
+
+        board_frame = ttk.Frame(self.game_frame, style="TFrame")
+        board_frame.pack(expand=True, padx=20, pady=10)
+
+        self.buttons = []
+        self.rendered = [[("", "Game.TButton", tk.NORMAL)] * self.board_size for _ in range(self.board_size)]
+        btn_size = max(30, 450 // self.board_size)
+        small = self.board_size > 7
+        self.game_style("Game.TButton")
+        self.style.configure("Game.TButton", font=SMALL_GAME_FONT if small else DEFAULT_FONT, padding=1 if small else 5,
+                             width=2 if small else 3)
+        for i in range(self.board_size):
+            board_frame.grid_rowconfigure(i, weight=1, minsize=btn_size)
+            board_frame.grid_columnconfigure(i, weight=1, minsize=btn_size)
+            row_buttons = []
+            for j in range(self.board_size):
+                button = ttk.Button(
+                    board_frame, text="", style="Game.TButton",
+                    command=lambda r=i, c=j: self.player_move(r, c))
+                button.grid(row=i, column=j, sticky="nsew", padx=3, pady=3)
+                row_buttons.append(button)
+            self.buttons.append(row_buttons)
+
+        # In-game controls
+        self.ingame_control_frame = ttk.Frame(self.game_frame, style="TFrame")
+        self.ingame_control_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 20), padx=20)
+        self.ingame_control_frame.columnconfigure((0, 1, 2), weight=1)
+
+        self.reset_button = AnimatedButton(self.ingame_control_frame, text="Reset", command=self.reset_game)
+        self.reset_button.grid(row=0, column=0, padx=5, sticky="ew")
+        
+        self.undo_button = AnimatedButton(self.ingame_control_frame, text="Undo", command=self.undo_move, state=tk.DISABLED)
+        self.undo_button.grid(row=0, column=1, padx=5, sticky="ew")
+
+        self.back_button = AnimatedButton(self.ingame_control_frame, text="Back to Menu", command=self.create_menu)
+        self.back_button.grid(row=0, column=2, padx=5, sticky="ew")
+
+        # End-game controls (initially hidden)
+        self.endgame_control_frame = ttk.Frame(self.game_frame, style="TFrame")
+        self.endgame_control_frame.columnconfigure((0, 1), weight=1)
+
+        self.play_again_button = AnimatedButton(self.endgame_control_frame, text="Play Again", command=lambda: self.start_game(keep_starter=False))
+        self.back_to_menu_button_end = AnimatedButton(self.endgame_control_frame, text="Back to Menu", command=self.create_menu)
+        self.play_again_button.grid(row=0, column=0, padx=10, sticky="ew")
+        self.back_to_menu_button_end.grid(row=0, column=1, padx=10, sticky="ew")
+
+    # --- Board Rendering ---
+    # self.rendered mirrors what every board button shows, so a repaint only touches
+    # buttons whose text, style or state actually differ, with one config call each.
+    def render_cell(self, row, col, text, style, state):
+        if self.rendered[row][col] == (text, style, state): return
+        self.rendered[row][col] = (text, style, state)
+        self.game_style(style)
+        self.buttons[row][col].config(text=text, style=style, state=state)
+
+    def sync_board(self):
+        # Brings every button in line with the game model
+        board = self.game.board
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell: self.render_cell(r, c, cell, f"{cell}.Game.TButton", tk.DISABLED)
+                else: self.render_cell(r, c, "", "Game.TButton", tk.DISABLED if self.game_over else tk.NORMAL)
+
+    def update_status_label(self):
+        if self.game_over or not self.status_label.winfo_exists(): return
+        
+        if self.game_mode == "AI":
+            text = "Your Turn (X)" if self.current_player == "X" else "AI's Turn (O)..."
+            color = X_COLOR if self.current_player == "X" else O_COLOR
+        else:
+            text = f"Player {self.current_player}'s Turn"
+            color = X_COLOR if self.current_player == "X" else O_COLOR
+        
+        self.status_label.config(text=text, foreground=color)
+
+    def player_move(self, row, col):
+        if self.game_over or (self.game_mode == "AI" and self.current_player == "O"):
+            return
+
+        player = self.current_player
+        if self.game.make_move(row, col, player):
+            self.move_history.append((row, col, player))
+            self.update_button(row, col, player)
+            
+            if not self.check_game_end(player):
+                self.current_player = "O" if player == "X" else "X"
+                self.game.current_player = self.current_player
+                self.update_status_label()
+                if self.game_mode == "AI" and self.current_player == "O":
+                    self.ai_after_id = self.master.after(random.randint(400, 700), self.ai_move)
+                # Undo stays available while the AI thinks; it cancels the search
+                self.undo_button.config(state=tk.NORMAL)
+
+    def ai_move(self):
+        self.ai_after_id = None
+        if self.game_over or self.current_player != "O": return
+
+        self.ai_token += 1
+        self.ai_pending = self.ai_token
+        self.ai_worker.submit(self.ai_token, self.ai, self.game)
+        self.master.after(AI_POLL_MS, self.poll_ai_result)
+
+    def poll_ai_result(self):
+        while True:
+            try:
+                token, move, stats, error = self.ai_worker.results.get_nowait()
+            except queue.Empty:
+                break
+            if token == self.ai_pending: # Results of cancelled searches are dropped here
+                self.ai_pending = None
+                if error is not None:
+                    self.ai_failed(f"{type(error).__name__}: {error}")
+                    return
+                self.update_search_stats(stats)
+                self.apply_ai_move(move)
+                return
+        if self.ai_pending is not None:
+            self.master.after(AI_POLL_MS, self.poll_ai_result)
+
+    def toggle_search_stats(self, event=None):
+        self.show_search_stats = not self.show_search_stats
+        if self.debug_label is None or not self.debug_label.winfo_exists(): return
+        if self.show_search_stats:
+            self.debug_label.pack(side=tk.TOP, fill=tk.X, after=self.status_label)
+            self.update_search_stats(self.ai.last_stats if self.ai else None)
+        else:
+            self.debug_label.pack_forget()
+
+    def update_search_stats(self, stats):
+        if not self.show_search_stats or self.debug_label is None or not self.debug_label.winfo_exists(): return
+        text = stats.summary() if stats else "No search stats"
+        if self.reset_ms is not None: text += f"\nboard reset {self.reset_ms:.1f} ms"
+        self.debug_label.config(text=text)
+
+    def cancel_ai(self):
+        if self.ai_after_id is not None:
+            self.master.after_cancel(self.ai_after_id)
+            self.ai_after_id = None
+        self.ai_pending = None
+        self.ai_worker.cancel()
+
+    def apply_ai_move(self, move):
+        if self.game_over or self.current_player != "O": return
+        if not move or not self.game.make_move(*move, "O"):
+            self.ai_failed(f"no legal move ({move})")
+            return
+        row, col = move
+        self.move_history.append((row, col, "O"))
+        self.update_button(row, col, "O")
+        if not self.check_game_end("O"):
+            self.current_player = "X"
+            self.game.current_player = self.current_player
+            self.update_status_label()
+            self.undo_button.config(state=tk.NORMAL)
+
+    def ai_failed(self, reason):
+        # The search didn't produce a move: take back just the player's move, as undo does
+        # mid-search, so the board is live again and the player can retry
+        if self.game_over or self.current_player != "O" or not self.move_history: return
+        r_p, c_p, _ = self.move_history.pop()
+        self._reset_cell(r_p, c_p)
+        self.current_player = "X"
+        self.game.current_player = self.current_player
+        if not self.move_history: self.undo_button.config(state=tk.DISABLED)
+        self.ai.last_stats = None # The worker is idle; don't let the overlay show the previous search
+        self.update_search_stats(None)
+        self.status_label.config(text=f"AI error ({reason}); your move was taken back", foreground=X_COLOR)
+
+    def undo_move(self):
+        if self.game_over or not self.move_history:
+            return
+
+        if self.game_mode == "AI" and (self.ai_pending is not None or self.ai_after_id is not None):
+            # The AI is still thinking: stop it and take back just the player's move
+            self.cancel_ai()
+            r_p, c_p, _ = self.move_history.pop()
+            self._reset_cell(r_p, c_p)
+            self.current_player = "X"
+        elif self.game_mode == "AI":
+            if len(self.move_history) < 2: return # Can't undo if not a full turn has passed
+            # Undo AI move
+            r_ai, c_ai, _ = self.move_history.pop()
+            self._reset_cell(r_ai, c_ai)
+            # Undo Player move
+            r_p, c_p, _ = self.move_history.pop()
+            self._reset_cell(r_p, c_p)
+            self.current_player = "X"
+        else: # Multiplayer
+            r, c, player = self.move_history.pop()
+            self._reset_cell(r, c)
+            self.current_player = player
+
+        self.game.current_player = self.current_player
+        self.update_status_label()
+        if not self.move_history:
+            self.undo_button.config(state=tk.DISABLED)
+
+    def _reset_cell(self, r, c):
+        self.game.unmake_move(r, c)
+        self.render_cell(r, c, "", "Game.TButton", tk.NORMAL)
+    
+    def check_game_end(self, last_player):
+        winner, line_type, line_index = self.game.check_winner()
+        
+        if winner:
+            self.game_over = True
+            self.save_game_record(winner)
+            self.show_end_game_buttons() # Disables the empty cells before the winning line starts flashing
+            self.highlight_winner(winner, line_type, line_index)
+            status_text = "You Win!" if winner == "X" and self.game_mode == "AI" else f"AI Wins!" if self.game_mode == "AI" else f"Player {winner} Wins!"
+            status_color = X_COLOR if winner == "X" else O_COLOR
+            self.status_label.config(text=status_text, foreground=status_color)
+            return True
+        elif self.game.is_board_full():
+            self.game_over = True
+            self.save_game_record("draw")
+            self.status_label.config(text="It's a Draw!", foreground=FG_COLOR)
+            self.show_end_game_buttons()
+            return True
+        return False
+
+    def save_game_record(self, result):
+        # Appends the finished game to the log that `python -m tictactoe analyze` reads
+        try:
+            save_game(self.board_size, self.win_length, self.move_history, result)
+        except OSError:
+            pass # An unwritable home directory shouldn't interrupt the game
+
+    def highlight_winner(self, winner, line_type, line_index, flashes=5):
+        win_cells = []
+        if line_type == "cells":
+            win_cells = list(line_index)
+        elif line_type == "row":
+            win_cells = [(line_index, j) for j in range(self.board_size)]
+        elif line_type == "col":
+            win_cells = [(i, line_index) for i in range(self.board_size)]
+        elif line_type == "diag":
+            if line_index == 0:
+                win_cells = [(i, i) for i in range(self.board_size)]
+            else:
+                win_cells = [(i, self.board_size - 1 - i) for i in range(self.board_size)]
+        
+        def flash(count):
+            self.flash_after_id = None
+            is_flash_style = count % 2 == 1
+            style_to_apply = f"{winner}.{'Flash' if is_flash_style else 'Win'}.Game.TButton"
+            for r, c in win_cells:
+                self.render_cell(r, c, winner, style_to_apply, tk.DISABLED)
+            if count > 0:
+                self.flash_after_id = self.master.after(150, lambda: flash(count - 1))
+        
+        flash(flashes * 2)
+
+    def cancel_flash(self):
+        # The board buttons outlive the game, so a running win animation must not reach the next one
+        if self.flash_after_id is not None:
+            self.master.after_cancel(self.flash_after_id)
+            self.flash_after_id = None
+
+    def show_end_game_buttons(self):
+        self.ingame_control_frame.pack_forget()
+        self.endgame_control_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 20), padx=20)
+        self.sync_board()
+
+    def update_button(self, row, col, player):
+        self.render_cell(row, col, player, f"{player}.Game.TButton", tk.DISABLED)
+
+# --- Main Execution ---
+def main(argv=None):
+    root = tk.Tk()
+    gui = TicTacToeGUI(root)
+    root.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    main()
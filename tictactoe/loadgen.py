@@ -0,0 +1,138 @@
+# Load generator for `python -m tictactoe serve`: many connections, each playing several
+# games at once with random moves for X, reporting moves per second and latency.
+#   python -m tictactoe loadgen --connections 50 --parallel 20 --games 5000
+import argparse
+import asyncio
+import collections
+import itertools
+import json
+import random
+import sys
+import time
+
+from .server import MAX_LINE, LatencyHistogram, summarize_histogram
+
+class Connection:
+    # Replies are matched to requests by id, so one socket can carry many games at once
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.reader_task = asyncio.create_task(self.read_replies())
+
+    @classmethod
+    async def open(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def read_replies(self):
+        try:
+            while line := await self.reader.readline():
+                reply = json.loads(line)
+                future = self.pending.pop(reply.get("id"), None)
+                if future is not None and not future.done(): future.set_result(reply)
+        finally:
+            for future in self.pending.values():
+                if not future.done(): future.set_exception(ConnectionError("server closed the connection"))
+
+    async def call(self, request):
+        request_id = next(self.ids)
+        future = self.pending[request_id] = asyncio.get_running_loop().create_future()
+        self.writer.write(json.dumps(dict(request, id=request_id), separators=(",", ":")).encode() + b"\n")
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.reader_task.cancel()
+
+class LoadStats:
+    def __init__(self):
+        self.latency = {"new": LatencyHistogram(), "move": LatencyHistogram()}
+        self.moves = 0
+        self.games = 0
+        self.busy = 0
+        self.results = collections.Counter()
+
+async def call(connection, request, stats, rng):
+    # Retries while the server answers "busy"; records the latency of the accepted attempt
+    while True:
+        start = time.perf_counter()
+        reply = await connection.call(request)
+        if reply.get("error") == "busy":
+            stats.busy += 1
+            await asyncio.sleep(reply.get("retry_after_ms", 50) / 1000 * rng.uniform(0.5, 1.5)) # Jitter spreads the retries out
+            continue
+        if not reply["ok"]: raise RuntimeError(f"{request['op']} failed: {reply['error']}")
+        stats.latency[request["op"]].record(time.perf_counter() - start)
+        return reply
+
+async def play_games(connection, game_numbers, args, stats, rng):
+    size, k = args.size, args.k or args.size
+    for _ in iter(lambda: next(game_numbers, None), None):
+        new = {"op": "new", "size": size, "k": k, "difficulty": args.difficulty, "first": rng.choice("XO")}
+        if args.time_ms: new["time_ms"] = args.time_ms
+        reply = await call(connection, new, stats, rng)
+        game_id = reply["game"]
+        empty = {(r, c) for r in range(size) for c in range(size)}
+        if reply["ai_move"]: empty.discard(tuple(reply["ai_move"]))
+        result = reply["result"]
+        while result is None:
+            row, col = rng.choice(sorted(empty))
+            reply = await call(connection, {"op": "move", "game": game_id, "row": row, "col": col}, stats, rng)
+            stats.moves += 1
+            empty.discard((row, col))
+            if reply["ai_move"]:
+                empty.discard(tuple(reply["ai_move"]))
+                stats.moves += 1
+            result = reply["result"]
+        await connection.call({"op": "close", "game": game_id})
+        stats.games += 1
+        stats.results[result] += 1
+
+async def run(args):
+    stats = LoadStats()
+    game_numbers = iter(range(args.games))
+    connections = [await Connection.open(args.host, args.port) for _ in range(args.connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(play_games(connection, game_numbers, args, stats, random.Random(args.seed * 100_003 + i))
+                           for i, connection in enumerate(connections) for _ in range(args.parallel)))
+    elapsed = time.perf_counter() - start
+    server_stats = await connections[0].call({"op": "stats"})
+    for connection in connections:
+        await connection.close()
+
+    print(f"{stats.games:,} games, {stats.moves:,} moves in {elapsed:.2f}s: {stats.moves / elapsed:,.0f} moves/s, "
+          f"{stats.games / elapsed:,.1f} games/s; {stats.busy:,} busy retries")
+    print(f"results: X {stats.results['X']:,}  O {stats.results['O']:,}  draw {stats.results['draw']:,}")
+    header = f"{'':<8}{'count':>9}{'mean ms':>9}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}"
+    print(f"\nclient round trip\n{header}")
+    for op, histogram in stats.latency.items():
+        print(summarize_histogram(op, histogram.as_dict()))
+    counters = server_stats["counters"]
+    print(f"\nserver: {counters.get('searches', 0):,} searches, {counters.get('coalesced', 0):,} coalesced, "
+          f"{counters.get('busy', 0):,} busy replies\n{header}")
+    for op, data in server_stats["latency"].items():
+        print(summarize_histogram(op, data))
+    return 0
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python -m tictactoe loadgen", description="Play many games against a running server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--connections", type=int, default=20)
+    parser.add_argument("--parallel", type=int, default=10, help="Games in progress per connection")
+    parser.add_argument("--games", type=int, default=1_000, help="Total games to play")
+    parser.add_argument("--size", type=int, default=3, choices=range(3, 16), metavar="{3..15}")
+    parser.add_argument("--k", type=int, help="Marks in a row to win (default: the board size)")
+    parser.add_argument("--difficulty", default="Hard", choices=("Easy", "Medium", "Hard", "MCTS"))
+    parser.add_argument("--time-ms", type=int, help="AI budget per move (the server defaults to 200 beyond 3x3)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    try:
+        return asyncio.run(run(args))
+    except ConnectionError as error:
+        print(f"loadgen: {error}", file=sys.stderr)
+        return 1
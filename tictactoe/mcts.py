@@ -0,0 +1,255 @@
+import math
+import random
+import time
+
+from .board import WIN_LINES, BitboardTicTacToe, get_cell_lines, get_windows
+from .stats import SearchStats
+
+# --- Monte Carlo Tree Search ---
+# UCT: walk down the tree by upper confidence bound, add one node, finish the game with
+# random moves, and credit the result to every node on the way back. Unlike MinimaxAI it
+# needs no horizon, so its strength follows the playout budget rather than the board size.
+# Like MinimaxAI it plays O and has the same get_best_move/last_stats/listener interface.
+DIFFICULTY_PLAYOUTS = {"Medium": 2_000, "Hard": 10_000}
+EXPLORATION = 1.4 # UCT constant, about sqrt(2) for results in [0, 1]
+CHECK_EVERY = 16 # Playouts between clock and cancellation checks
+
+_CELL_MASKS = {}
+
+def get_cell_masks(size, k):
+    # [bit] -> masks of every winning line through that cell
+    if (size, k) not in _CELL_MASKS:
+        if k == size:
+            get_cell_lines(size) # Builds WIN_LINES for sizes beyond the precomputed ones
+            masks = [mask for mask, _, _ in WIN_LINES[size]]
+        else:
+            masks = [mask for mask, _ in get_windows(size, k)]
+        _CELL_MASKS[size, k] = [tuple(mask for mask in masks if mask >> bit & 1) for bit in range(size * size)]
+    return _CELL_MASKS[size, k]
+
+class Node:
+    __slots__ = ("move", "player", "parent", "children", "untried", "visits", "wins", "result", "x_bits", "o_bits")
+
+    def __init__(self, move, player, parent, x_bits, o_bits):
+        self.move = move
+        self.player = player # Who played `move` to reach this node
+        self.parent = parent
+        self.children = []
+        self.untried = None # Filled on first visit
+        self.visits = 0
+        self.wins = 0.0 # From `player`'s point of view: 1 per win, 0.5 per draw
+        self.result = None # "X", "O" or "draw" once the game is over here
+        self.x_bits = x_bits
+        self.o_bits = o_bits
+
+class MCTSAI:
+    def __init__(self, game, difficulty="Hard", playouts=None, time_limit_ms=None, workers=1, exploration=EXPLORATION,
+                 max_nodes=200_000):
+        self.game = game
+        self.difficulty = difficulty
+        self.playouts = playouts # Per move; ignored when time_limit_ms is set
+        self.time_limit_ms = time_limit_ms
+        self.workers = workers # > 1 runs extra playout batches in a process pool and merges root visits
+        self.exploration = exploration
+        self.max_nodes = max_nodes # Past this the tree stops growing and only playouts run
+        self._executor = None
+        self.root = None # Kept between moves and re-rooted on the position actually reached
+        self.variant = None # (size, k) the kept tree was grown for
+        self.tree_size = 0
+        self.last_stats = None
+        self.listeners = []
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def reset_tables(self):
+        # Drops the tree kept between moves, as MinimaxAI.reset_tables drops its tables
+        self.root = None
+        self.tree_size = 0
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def get_best_move(self, game=None, cancel_event=None):
+        game = self.game if game is None else game
+        start = time.perf_counter()
+        self._playouts = self._new_nodes = self._max_ply = 0
+        move, source = self.choose_move(game, cancel_event)
+        self.last_stats = SearchStats(source, move, nodes=self._new_nodes, leaf_evaluations=self._playouts,
+                                      max_ply=self._max_ply, wall_time_ms=(time.perf_counter() - start) * 1000)
+        for listener in self.listeners:
+            listener(self.last_stats)
+        return move
+
+    def choose_move(self, game, cancel_event=None):
+        available_moves = game.get_available_moves()
+        if not available_moves: return None, "mcts"
+        if self.difficulty == "Easy": return random.choice(available_moves), "random"
+
+        # Tactics the playouts would only find slowly: take a win, block a single threat
+        blocks = []
+        for move in available_moves:
+            if game.is_winning_move(*move, "O"): return move, "forced move"
+            if game.is_winning_move(*move, "X"): blocks.append(move)
+        if len(blocks) == 1: return blocks[0], "forced move"
+
+        board = game.copy() if hasattr(game, "x_bits") else BitboardTicTacToe.from_game(game)
+        root = self.reroot(board)
+        futures = []
+        if self.workers > 1:
+            if self._executor is None:
+                from concurrent.futures import ProcessPoolExecutor # Slow to import; see MinimaxAI.parallel_search_root
+                self._executor = ProcessPoolExecutor(max_workers=self.workers - 1)
+            futures = [self._executor.submit(_run_batch, board.copy(), self.playouts_budget(), self.time_limit_ms,
+                                             self.exploration, random.getrandbits(64))
+                       for _ in range(self.workers - 1)]
+        try:
+            if not self.search(board, root, cancel_event): return None, "cancelled"
+            visits = {child.move: child.visits for child in root.children}
+            for future in futures:
+                batch_visits, playouts = future.result()
+                self._playouts += playouts
+                for move, count in batch_visits.items():
+                    visits[move] = visits.get(move, 0) + count
+        finally:
+            for future in futures:
+                future.cancel()
+        if not visits: return random.choice(available_moves), "mcts"
+        return max(visits, key=visits.get), "mcts"
+
+    def playouts_budget(self):
+        return self.playouts or DIFFICULTY_PLAYOUTS.get(self.difficulty, DIFFICULTY_PLAYOUTS["Hard"])
+
+    def reroot(self, board):
+        # The root is the position with O to move; after O's move and the opponent's reply
+        # the new position is one of its grandchildren, whose subtree is kept. Bitboards of
+        # different sizes can be equal, so a tree for another variant is never reused.
+        x_bits, o_bits = board.x_bits, board.o_bits
+        variant = (board.size, getattr(board, "k", board.size))
+        if variant != self.variant: self.root, self.variant = None, variant
+        candidates = [self.root] if self.root is not None else []
+        if self.root is not None:
+            candidates += [grandchild for child in self.root.children for grandchild in child.children]
+        for node in candidates:
+            if node.x_bits == x_bits and node.o_bits == o_bits and node.player == "X":
+                node.parent = None
+                self.root = node
+                self.tree_size = self.count_nodes(node)
+                return node
+        self.root = Node(None, "X", None, x_bits, o_bits)
+        self.tree_size = 1
+        return self.root
+
+    def count_nodes(self, node):
+        count, stack = 0, [node]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children)
+        return count
+
+    def search(self, board, root, cancel_event=None):
+        # Runs playouts from `root` until the budget is spent; False if cancelled
+        deadline = time.perf_counter() + self.time_limit_ms / 1000 if self.time_limit_ms is not None else None
+        budget = None if deadline is not None else self.playouts_budget()
+        masks = get_cell_masks(board.size, getattr(board, "k", board.size))
+        x_bits, o_bits, n_moves = board.x_bits, board.o_bits, len(board.moves)
+        log, sqrt, c = math.log, math.sqrt, self.exploration
+        full_mask = board.full_mask
+        playouts = 0
+        while True:
+            if not playouts % CHECK_EVERY:
+                if cancel_event is not None and cancel_event.is_set(): return False
+                if deadline is not None and playouts and time.perf_counter() > deadline: break
+            if budget is not None and playouts >= budget: break
+
+            # Selection
+            node, ply = root, 0
+            while node.result is None and not node.untried and node.children:
+                log_visits = log(node.visits)
+                node = max(node.children, key=lambda child: child.wins / child.visits + c * sqrt(log_visits / child.visits))
+                board.make_move(*node.move, node.player)
+                ply += 1
+
+            # Expansion
+            if node.result is None:
+                if node.untried is None:
+                    node.untried = board.get_available_moves()
+                    random.shuffle(node.untried)
+                if node.untried and self.tree_size < self.max_nodes:
+                    move = node.untried.pop()
+                    player = "O" if node.player == "X" else "X"
+                    board.make_move(*move, player)
+                    child = Node(move, player, node, board.x_bits, board.o_bits)
+                    winner, _, _ = board.check_winner()
+                    if winner: child.result = winner
+                    elif board.is_board_full(): child.result = "draw"
+                    node.children.append(child)
+                    node = child
+                    ply += 1
+                    self.tree_size += 1
+                    self._new_nodes += 1
+            if ply > self._max_ply: self._max_ply = ply
+
+            # Simulation
+            result = node.result
+            if result is None:
+                result = _playout(board.x_bits, board.o_bits, "O" if node.player == "X" else "X", full_mask, masks)
+            playouts += 1
+
+            # Backpropagation
+            while node is not None:
+                node.visits += 1
+                if result == node.player: node.wins += 1
+                elif result == "draw": node.wins += 0.5
+                node = node.parent
+
+            board.x_bits, board.o_bits = x_bits, o_bits
+            del board.moves[n_moves:]
+        self._playouts += playouts
+        return True
+
+def _playout(x_bits, o_bits, to_move, full_mask, masks):
+    # Random moves on bare bitboards until someone completes a line: "X", "O" or "draw"
+    empty = full_mask & ~(x_bits | o_bits)
+    cells = []
+    while empty:
+        low = empty & -empty
+        cells.append(low.bit_length() - 1)
+        empty ^= low
+    random.shuffle(cells)
+    x_to_move = to_move == "X"
+    for bit in cells:
+        if x_to_move:
+            x_bits |= 1 << bit
+            for mask in masks[bit]:
+                if x_bits & mask == mask: return "X"
+        else:
+            o_bits |= 1 << bit
+            for mask in masks[bit]:
+                if o_bits & mask == mask: return "O"
+        x_to_move = not x_to_move
+    return "draw"
+
+# --- Parallel Playout Batches ---
+# Each pool process grows its own tree from the same root for the same budget; the
+# caller adds up root visit counts, which is root parallelisation. Trees are per
+# process and reused across batches when the next position is in them; reroot drops a
+# tree grown for another board size or win length.
+_WORKER_MCTS = {}
+
+def _run_batch(board, playouts, time_limit_ms, exploration, seed):
+    random.seed(seed)
+    ai = _WORKER_MCTS.get(exploration)
+    if ai is None:
+        ai = _WORKER_MCTS[exploration] = MCTSAI(None, exploration=exploration)
+    ai.playouts, ai.time_limit_ms = playouts, time_limit_ms
+    ai._playouts = ai._new_nodes = ai._max_ply = 0
+    root = ai.reroot(board)
+    ai.search(board, root)
+    return {child.move: child.visits for child in root.children}, ai._playouts
@@ -0,0 +1,104 @@
+import mmap
+import os
+
+from .board import WIN_LINES
+
+# --- Perfect-Play Database (3x3) ---
+# Every reachable 3x3 position, solved once. A position's index is its base-3 number
+# (cell r * 3 + c is digit r * 3 + c; 0 empty, 1 X, 2 O). Each index owns one byte:
+# bits 0-1 hold the value with O to move and bits 2-3 with X to move, stored as
+# value + 1 from O's point of view (0 loss, 1 draw, 2 win); 3 marks an unreachable slot.
+PERFECT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "perfect_3x3.bin")
+PERFECT_DB_MAGIC = b"TTT3"
+PERFECT_DB_HEADER = 8 # magic, board size, 3 reserved bytes
+POWERS_OF_3 = tuple(3 ** i for i in range(9))
+
+def position_index(game):
+    index = 0
+    for r, row in enumerate(game.board):
+        for c, cell in enumerate(row):
+            if cell: index += POWERS_OF_3[r * 3 + c] * (1 if cell == "X" else 2)
+    return index
+
+def solve_3x3():
+    values = bytearray(b"\xff" * 3 ** 9)
+    line_masks = [mask for mask, _, _ in WIN_LINES[3]]
+    full_mask = (1 << 9) - 1
+
+    def solve(x_bits, o_bits, index, o_to_move):
+        shift = 0 if o_to_move else 2
+        stored = values[index] >> shift & 3
+        if stored != 3: return stored - 1
+        if any(x_bits & mask == mask for mask in line_masks): value = -1
+        elif any(o_bits & mask == mask for mask in line_masks): value = 1
+        elif x_bits | o_bits == full_mask: value = 0
+        else:
+            occupied = x_bits | o_bits
+            if o_to_move:
+                value = max(solve(x_bits, o_bits | 1 << bit, index + 2 * POWERS_OF_3[bit], False)
+                            for bit in range(9) if not occupied >> bit & 1)
+            else:
+                value = min(solve(x_bits | 1 << bit, o_bits, index + POWERS_OF_3[bit], True)
+                            for bit in range(9) if not occupied >> bit & 1)
+        values[index] = values[index] & ~(3 << shift) | (value + 1) << shift
+        return value
+
+    solve(0, 0, 0, False) # X opens
+    solve(0, 0, 0, True) # O opens (the AI starts every other round)
+    return values
+
+def build_perfect_play_db(path=PERFECT_DB_PATH):
+    values = solve_3x3()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(PERFECT_DB_MAGIC + bytes([3, 0, 0, 0]))
+        f.write(values)
+    return sum(1 for byte in values if byte != 0xFF)
+
+class PerfectPlayDB:
+    # Memory-mapped on first lookup, so creating one costs nothing at startup
+    def __init__(self, path=PERFECT_DB_PATH):
+        self.path = path
+        self._data = None
+        self._unavailable = False
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._unavailable = True
+            return False
+        if data[:4] != PERFECT_DB_MAGIC or data[4] != 3 or len(data) != PERFECT_DB_HEADER + 3 ** 9:
+            data.close()
+            self._unavailable = True
+            return False
+        self._data = data
+        return True
+
+    def available(self):
+        return self._data is not None or (not self._unavailable and self._load())
+
+    def value(self, index, o_to_move):
+        if not self.available(): return None
+        stored = self._data[PERFECT_DB_HEADER + index] >> (0 if o_to_move else 2) & 3
+        return None if stored == 3 else stored - 1
+
+    def move_values(self, game):
+        # [(move, value after O plays it)], or None if the position is not in the table
+        if game.size != 3 or not self.available(): return None
+        index = position_index(game)
+        scored = []
+        for r, c in game.get_available_moves():
+            value = self.value(index + 2 * POWERS_OF_3[r * 3 + c], False)
+            if value is None: return None
+            scored.append(((r, c), value))
+        return scored
+
+PERFECT_DB = PerfectPlayDB()
+
+def main(argv):
+    # python -m tictactoe build-db [path]
+    path = argv[0] if argv else PERFECT_DB_PATH
+    print(f"Solved {build_perfect_play_db(path)} positions into {path}")
+    return 0
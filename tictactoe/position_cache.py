@@ -0,0 +1,238 @@
+import atexit
+import os
+import queue
+import struct
+import sys
+import threading
+
+from .transposition import TranspositionTable, board_symmetries
+
+try:
+    import fcntl # Serialises appends and compaction between processes; not on Windows
+except ImportError:
+    fcntl = None
+
+# --- Persistent Position Cache ---
+# Search results that outlive the process: one append-only log per board variant,
+# shared by every process on the machine. A record is a canonical Zobrist key (side to
+# move included) with its score, depth and best move. Readers index the log on first
+# use and pick up other processes' appends on refresh(); writers append whole records
+# from a background thread. Appends stop at max_bytes until `python -m tictactoe cache
+# compact` rewrites the log with one record per position. The in-memory index is capped
+# separately at max_entries, keeping the deepest results, since every process has its own.
+CACHE_DIR = os.environ.get("TICTACTOE_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "tictactoe")
+CACHE_MAGIC = b"TTPC"
+CACHE_VERSION = 1
+CACHE_HEADER = 8 # magic, version, board size, k, reserved
+RECORD = struct.Struct("<QdiHBB") # key, score, depth, canonical move cell, flags, checksum
+NO_MOVE = 0xFFFF
+HEURISTIC_FLAG = 4 # Set when horizon positions were scored by LineEvaluator; the low 2 bits are the TT flag
+MAX_BYTES = 64 << 20
+READ_CHUNK = RECORD.size << 15
+MAX_ENTRIES = 200_000 # About 45 MB of index per process; a full log holds about 14 times as many records
+
+def cache_path(size, k=None, directory=None):
+    return os.path.join(directory or CACHE_DIR, f"positions-{size}x{size}-k{k or size}.log")
+
+def _checksum(data):
+    return sum(data) & 0xFF
+
+def pack_record(key, depth, score, flag, move_cell):
+    data = RECORD.pack(key, score, depth, move_cell, flag, 0)
+    return data[:-1] + bytes([_checksum(data[:-1])])
+
+def read_records(data):
+    # (key, depth, score, flags, move cell) for every intact record; a torn tail is skipped
+    end = len(data) - (len(data) - CACHE_HEADER) % RECORD.size
+    for offset in range(CACHE_HEADER, end, RECORD.size):
+        chunk = data[offset:offset + RECORD.size]
+        if _checksum(chunk[:-1]) != chunk[-1]: continue
+        key, score, depth, move_cell, flags, _ = RECORD.unpack(chunk)
+        yield key, depth, score, flags, move_cell
+
+_INVERSE_SYMMETRIES = {}
+
+def encode_move(size, symmetry, move):
+    # A move in the canonical orientation the key was taken in, as a cell index
+    return board_symmetries(size)[symmetry][move[0] * size + move[1]]
+
+def decode_move(size, symmetry, cell):
+    if size not in _INVERSE_SYMMETRIES:
+        _INVERSE_SYMMETRIES[size] = [{target: source for source, target in enumerate(perm)}
+                                     for perm in board_symmetries(size)]
+    return divmod(_INVERSE_SYMMETRIES[size][symmetry][cell], size)
+
+class PositionCache:
+    def __init__(self, size, k=None, path=None, max_bytes=MAX_BYTES, max_entries=MAX_ENTRIES):
+        self.size = size
+        self.k = k or size
+        self.path = path or cache_path(size, k)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries = None # key -> (depth, score, flags, move cell), loaded on first use
+        self._read_offset = CACHE_HEADER
+        self._inode = None
+        self._lock = threading.Lock()
+        self._queue = None
+        self._writer = None
+        self.dropped = 0 # Records not written because the log was full
+        self.pruned = 0 # Records dropped from the index to stay under max_entries
+
+    def refresh(self):
+        # Indexes records appended since the last call; rereads everything after a compaction
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            if self.entries is None: self.entries = {}
+            return
+        with self._lock:
+            if self.entries is None or stat.st_ino != self._inode or stat.st_size < self._read_offset:
+                self.entries, self._read_offset, self._inode = {}, CACHE_HEADER, stat.st_ino
+            if stat.st_size - self._read_offset < RECORD.size: return
+            try:
+                with open(self.path, "rb") as f:
+                    header = f.read(CACHE_HEADER)
+                    if header[:4] != CACHE_MAGIC or header[4:6] != bytes([CACHE_VERSION, self.size]): return
+                    f.seek(self._read_offset)
+                    while stat.st_size - self._read_offset >= RECORD.size: # In chunks, so a full log is never all in memory
+                        data = f.read(min(stat.st_size - self._read_offset, READ_CHUNK) // RECORD.size * RECORD.size)
+                        if not data: break
+                        for key, depth, score, flags, move_cell in read_records(header + data):
+                            self._remember(key, depth, score, flags, move_cell)
+                        self._read_offset += len(data)
+            except OSError:
+                return
+
+    def _remember(self, key, depth, score, flags, move_cell):
+        # Deeper results win; a later record replaces one of the same depth
+        old, new = self.entries.get(key), (depth, score, flags, move_cell)
+        if old is not None and (old[0] > depth or old == new): return False
+        self.entries[key] = new
+        if len(self.entries) > self.max_entries: self._prune()
+        return True
+
+    def _prune(self):
+        # Down to three quarters of max_entries in one go, so the sort is paid for rarely;
+        # solved positions sort first, being the deepest
+        keep = sorted(self.entries.items(), key=lambda item: item[1][0], reverse=True)[:self.max_entries * 3 // 4]
+        self.pruned += len(self.entries) - len(keep)
+        self.entries = dict(keep)
+
+    def lookup(self, key):
+        if self.entries is None: self.refresh()
+        return self.entries.get(key)
+
+    def store(self, key, depth, score, flag, move_cell=NO_MOVE, heuristic=False):
+        if self.entries is None: self.refresh()
+        flags = flag | (HEURISTIC_FLAG if heuristic else 0)
+        with self._lock:
+            if not self._remember(key, depth, score, flags, move_cell): return
+        if self._writer is None:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._write_loop, name="position-cache-writer", daemon=True)
+            self._writer.start()
+            atexit.register(self.flush)
+        self._queue.put(pack_record(key, depth, score, flags, move_cell))
+
+    def flush(self):
+        # Blocks until every stored record has reached the file
+        if self._queue is not None: self._queue.join()
+
+    def _write_loop(self):
+        while True:
+            records = [self._queue.get()]
+            while True:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._append(b"".join(records))
+            except OSError:
+                self.dropped += len(records)
+            finally:
+                for _ in records:
+                    self._queue.task_done()
+
+    def _append(self, data):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        while True:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if fcntl is None: break
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_ino == os.stat(self.path).st_ino: break
+            except OSError:
+                pass
+            os.close(fd) # Compacted while we waited for the lock: append to the new file instead
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                data = CACHE_MAGIC + bytes([CACHE_VERSION, self.size, self.k, 0]) + data
+            elif size + len(data) > self.max_bytes:
+                self.dropped += len(data) // RECORD.size
+                return
+            os.write(fd, data) # One write per batch, so other processes never see a torn record
+        finally:
+            os.close(fd) # Also releases the lock
+
+_CACHES = {}
+
+def get_position_cache(size, k=None):
+    # One cache per variant per process, shared by every AI
+    key = (size, k or size)
+    if key not in _CACHES:
+        _CACHES[key] = PositionCache(size, k)
+    return _CACHES[key]
+
+# --- Compaction ---
+def compact(path, max_bytes=MAX_BYTES):
+    # Rewrites the log with only the best record per position; if that is still over half
+    # of max_bytes, the shallowest positions go first. Returns (records before, after).
+    fd = os.open(path, os.O_RDWR)
+    try:
+        if fcntl is not None: fcntl.flock(fd, fcntl.LOCK_EX) # Appends wait until the new file is in place
+        with os.fdopen(os.dup(fd), "rb") as f:
+            data = f.read()
+        header = data[:CACHE_HEADER]
+        if header[:4] != CACHE_MAGIC: raise ValueError(f"{path} is not a position cache")
+        best = {}
+        count = 0
+        for key, depth, score, flags, move_cell in read_records(data):
+            count += 1
+            if key not in best or best[key][0] <= depth: best[key] = (depth, score, flags, move_cell)
+        keep = (max_bytes // 2 - CACHE_HEADER) // RECORD.size
+        entries = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:keep]
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(b"".join(pack_record(key, depth, score, flags, move_cell)
+                             for key, (depth, score, flags, move_cell) in entries))
+        os.replace(tmp_path, path) # Readers notice the new inode on their next refresh
+    finally:
+        os.close(fd)
+    return count, len(entries)
+
+def main(argv):
+    # python -m tictactoe cache {compact,stats} [paths]
+    import argparse, glob # Only the command line needs these; the AI imports this module
+    parser = argparse.ArgumentParser(prog="python -m tictactoe cache", description="Maintain the position cache.")
+    parser.add_argument("action", choices=("compact", "stats"))
+    parser.add_argument("paths", nargs="*", help=f"Cache logs (default: every log in {CACHE_DIR})")
+    parser.add_argument("--max-mb", type=float, default=MAX_BYTES / (1 << 20), help="Size limit the log is compacted for")
+    args = parser.parse_args(argv)
+    paths = args.paths or sorted(glob.glob(os.path.join(CACHE_DIR, "positions-*.log")))
+    if not paths:
+        print(f"No position caches in {CACHE_DIR}", file=sys.stderr)
+        return 0
+    for path in paths:
+        if args.action == "compact":
+            before, after = compact(path, int(args.max_mb * (1 << 20)))
+            print(f"{path}: {before:,} records -> {after:,}")
+        else:
+            with open(path, "rb") as f:
+                records = list(read_records(f.read()))
+            solved = len({key for key, depth, *_ in records if depth == TranspositionTable.SOLVED})
+            print(f"{path}: {len(records):,} records, {len({r[0] for r in records}):,} positions, {solved:,} solved, "
+                  f"{os.path.getsize(path) / (1 << 20):.1f} MB")
+    return 0
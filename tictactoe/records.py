@@ -0,0 +1,138 @@
+# Batch analysis of saved games:
+#   python -m tictactoe analyze                       # every game in the default log
+#   python -m tictactoe analyze games.log -p Hard:200 --workers 4 --out analysis.jsonl
+import argparse
+import collections
+import json
+import os
+import random
+import sys
+import time
+
+from .ai import win_length
+from .gamelog import GAMES_PATH, encode_game, read_games
+from .perfect_db import PERFECT_DB
+from .selfplay import _as_o, _get_ai, describe_player, new_game, parse_player
+
+# --- Batch Analysis ---
+# Each game is replayed and MinimaxAI is asked for its move before every ply; plies where
+# the played move scores worse than the AI's are reported with both scores. Each game is
+# analyzed with the RNG seeded from its record and fresh tables, so a fixed-depth reference
+# gives the same report on every run and worker; a time budget still varies with the clock.
+ANALYSIS_BATCH = 8 # Games per pool task; each one is many searches, so small batches keep workers busy
+PROGRESS_SECONDS = 5
+
+def judge_move(ai, game, played):
+    # None if `played` is as good as the AI's own choice for O in `game` (the mover, after
+    # _as_o), else what the AI would have played, with both scores where they can be
+    # compared: perfect-play values on standard 3x3, elsewhere the played move searched to
+    # the depth the AI's move was scored at. Medium's random picks aren't held against the
+    # player; MCTS moves have no score.
+    suggested = ai.get_best_move(game)
+    scored = PERFECT_DB.move_values(game) if win_length(game) == 3 else None
+    if scored:
+        values = dict(scored)
+        best = max(values.values())
+        if values[played] == best: return None
+        if values.get(suggested) != best: suggested = next(move for move, value in scored if value == best)
+        return {"played": list(played), "ai": list(suggested), "ai_score": best, "played_score": values[played]}
+    stats = ai.last_stats
+    if suggested is None or tuple(suggested) == played or stats.source == "random": return None
+    report = {"played": list(played), "ai": list(suggested)}
+    if stats.source in ("search", "iterative deepening") and ai._root_score is not None:
+        ai.prepare(game)
+        ai.max_depth = stats.depth_completed - 1
+        played_score = ai.search_root(game, [played])[1]
+        if played_score >= ai._root_score: return None
+        report.update(ai_score=ai._root_score, played_score=played_score)
+    return report
+
+def analyze_game(record, player):
+    size, k, moves, result = record
+    random.seed(encode_game(size, k, moves, result)) # Ties break the same way wherever the game is analyzed
+    game = new_game(size, k)
+    ai = _get_ai(player)
+    ai.reset_tables() # Nor do the games this process analyzed before change the scores
+    differs = []
+    for ply, (row, col, mark) in enumerate(moves):
+        position = _as_o(game, mark)
+        if (row, col) not in position.get_available_moves():
+            return {"size": size, "k": k, "result": result, "plies": len(moves), "error": f"illegal move at ply {ply}"}
+        report = judge_move(ai, position, (row, col))
+        if report is not None: differs.append(dict(ply=ply, player=mark, **report))
+        game.make_move(row, col, mark)
+    return {"size": size, "k": k, "result": result, "plies": len(moves), "differs": differs}
+
+def _analyze_batch(batch, player):
+    return [analyze_game(record, player) for record in batch]
+
+def _batches(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch: yield batch
+
+def analyze_games(records, player, workers=1):
+    # Yields one report per game, in order. At most a few batches per worker are in
+    # flight, so the record stream is never read far ahead of the results.
+    if workers <= 1:
+        for batch in _batches(records, ANALYSIS_BATCH):
+            yield from _analyze_batch(batch, player)
+        return
+    from concurrent.futures import ProcessPoolExecutor # Slow to import, and the GUI only saves games
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for batch in _batches(records, ANALYSIS_BATCH):
+            pending.append(executor.submit(_analyze_batch, batch, player))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python -m tictactoe analyze",
+                                     description="Replay saved games and flag moves the AI would have played differently.")
+    parser.add_argument("paths", nargs="*", help=f"Game logs (default: {GAMES_PATH})")
+    parser.add_argument("-p", "--player", type=parse_player, default=parse_player("Hard"), help="Reference AI, e.g. Hard or Hard:200")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", help="JSON Lines file, one report per game (default: stdout)")
+    args = parser.parse_args(argv)
+    if args.player["difficulty"] == "Easy": parser.error("Easy plays at random; pick Medium, Hard or MCTS")
+
+    paths = args.paths or [GAMES_PATH]
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"No saved games at {path}" + ("; finished GUI games are saved there" if path == GAMES_PATH else ""),
+                  file=sys.stderr)
+            return 1
+
+    def records():
+        for path in paths:
+            for size, k, moves, result in read_games(path):
+                if size > 5 and not args.player["time_limit_ms"]:
+                    raise SystemExit(f"{path} has a {size}x{size} game; give the AI a time budget, e.g. -p Hard:500")
+                yield size, k, moves, result
+
+    out = open(args.out, "w") if args.out else sys.stdout
+    games = plies = flagged = 0
+    start = last_report = time.perf_counter()
+    try:
+        for report in analyze_games(records(), args.player, args.workers):
+            out.write(json.dumps(report, separators=(",", ":")) + "\n")
+            games += 1
+            plies += report["plies"]
+            flagged += len(report.get("differs", ()))
+            now = time.perf_counter()
+            if now - last_report > PROGRESS_SECONDS:
+                print(f"{games:,} games, {games / (now - start):,.1f} games/s", file=sys.stderr)
+                last_report = now
+    finally:
+        if out is not sys.stdout: out.close()
+    elapsed = time.perf_counter() - start
+    print(f"{games:,} games, {plies:,} moves in {elapsed:.2f}s ({games / elapsed if elapsed else 0:,.1f} games/s, "
+          f"{plies / elapsed if elapsed else 0:,.0f} moves/s); {describe_player(args.player)} differs on "
+          f"{flagged:,} moves ({flagged / plies if plies else 0:.1%})", file=sys.stderr)
+    return 0
@@ -0,0 +1,139 @@
+# Headless AI-vs-AI tournaments:
+#   python -m tictactoe selfplay --games 1000 --size 4 -a Hard:200 -b Medium --workers 4 --out games.jsonl
+#   python -m tictactoe selfplay --games 20 --size 15 --k 5 -a Hard:500 -b Medium:200
+#   python -m tictactoe selfplay --games 100 --size 5 -a MCTS:200 -b Hard:200
+# Player A plays X and player B plays O; who moves first alternates from game to game.
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+from .ai import MinimaxAI
+from .board import BitboardTicTacToe, KInARowTicTacToe
+from .mcts import MCTSAI
+
+DIFFICULTIES = ("Easy", "Medium", "Hard", "MCTS") # MCTS is MCTSAI at its Hard playout budget
+MARKS = {"A": "X", "B": "O"}
+
+def parse_player(spec):
+    # "Hard" or "Hard:250": difficulty plus an optional per-move time budget in ms
+    difficulty, _, time_ms = spec.partition(":")
+    if difficulty not in DIFFICULTIES:
+        raise argparse.ArgumentTypeError(f"unknown difficulty {difficulty!r}, expected one of {', '.join(DIFFICULTIES)}")
+    try:
+        time_limit_ms = int(time_ms) if time_ms else None
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad time budget {time_ms!r}") from None
+    return {"difficulty": difficulty, "time_limit_ms": time_limit_ms}
+
+def describe_player(config):
+    return config["difficulty"] + (f":{config['time_limit_ms']}ms" if config["time_limit_ms"] else "")
+
+# One AI per player config per process, so transposition tables stay warm across games
+_PROCESS_AIS = {}
+
+def _make_ai(config):
+    if config["difficulty"] == "MCTS": return MCTSAI(None, "Hard", time_limit_ms=config["time_limit_ms"])
+    return MinimaxAI(None, config["difficulty"], time_limit_ms=config["time_limit_ms"],
+                     position_cache=config.get("position_cache", False))
+
+def _get_ai(config):
+    key = (config["difficulty"], config["time_limit_ms"], config.get("position_cache", False))
+    if key not in _PROCESS_AIS:
+        _PROCESS_AIS[key] = _make_ai(config)
+    return _PROCESS_AIS[key]
+
+def _as_o(game, mark):
+    # MinimaxAI always plays O, so X is asked about the colour-swapped position
+    if mark == "O": return game
+    swapped = game.copy()
+    swapped.x_bits, swapped.o_bits = game.o_bits, game.x_bits
+    return swapped
+
+def new_game(size, k=None):
+    return BitboardTicTacToe(size) if k in (None, size) else KInARowTicTacToe(size, k)
+
+def play_game(task):
+    index, size, k, seed, players = task
+    random.seed(seed)
+    game = new_game(size, k)
+    first = "A" if index % 2 == 0 else "B"
+    side = first
+    moves = []
+    latency = {"A": [], "B": []}
+    start = time.perf_counter()
+    while True:
+        mark = MARKS[side]
+        move_start = time.perf_counter()
+        move = _get_ai(players[side]).get_best_move(_as_o(game, mark))
+        latency[side].append(time.perf_counter() - move_start)
+        game.make_move(*move, mark)
+        moves.append(move)
+        winner, _, _ = game.check_winner()
+        if winner or game.is_board_full(): break
+        side = "B" if side == "A" else "A"
+    return {
+        "game": index, "seed": seed, "size": size, "k": k or size, "first": first,
+        "winner": side if winner else None, "plies": len(moves), "moves": moves,
+        "move_ms": {s: {"count": len(v), "mean": round(1000 * sum(v) / len(v), 3) if v else None}
+                    for s, v in latency.items()},
+        "duration_ms": round(1000 * (time.perf_counter() - start), 3),
+    }
+
+def run_tournament(games, size, players, seed=0, workers=1, k=None):
+    # Yields one result dict per game, in game order
+    tasks = ((i, size, k, seed + i, players) for i in range(games))
+    if workers <= 1:
+        yield from map(play_game, tasks)
+        return
+    from concurrent.futures import ProcessPoolExecutor # Slow to import, and only needed with workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(play_game, tasks, chunksize=max(1, min(64, games // (workers * 8))))
+
+def summarize(results, players, elapsed, stream=sys.stderr):
+    games = len(results)
+    print(f"{games} games in {elapsed:.2f}s ({games / elapsed if elapsed else 0:.1f} games/s)", file=stream)
+    for side, other in (("A", "B"), ("B", "A")):
+        wins = sum(1 for r in results if r["winner"] == side)
+        losses = sum(1 for r in results if r["winner"] == other)
+        draws = games - wins - losses
+        move_count = sum(r["move_ms"][side]["count"] for r in results)
+        total_ms = sum(r["move_ms"][side]["mean"] * r["move_ms"][side]["count"] for r in results if r["move_ms"][side]["count"])
+        print(f"{side} ({MARKS[side]}, {describe_player(players[side])}): "
+              f"win {wins / games:.1%}  draw {draws / games:.1%}  loss {losses / games:.1%}  "
+              f"mean move {total_ms / move_count if move_count else 0:.2f} ms", file=stream)
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python -m tictactoe selfplay", description="Run AI-vs-AI games headlessly.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--size", type=int, default=3, choices=range(3, 16), metavar="{3..15}")
+    parser.add_argument("--k", type=int, help="Marks in a row to win (default: the board size)")
+    parser.add_argument("-a", "--player-a", type=parse_player, default=parse_player("Hard"), help="X, e.g. Hard, Hard:200 or MCTS:200")
+    parser.add_argument("-b", "--player-b", type=parse_player, default=parse_player("Medium"), help="O, e.g. Medium")
+    parser.add_argument("--seed", type=int, default=0, help="Game i is played with seed + i")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", help="JSON Lines file (default: stdout)")
+    parser.add_argument("--cache", action="store_true", help="Share results through the on-disk position cache")
+    args = parser.parse_args(argv)
+    if args.k is not None and not 3 <= args.k <= args.size:
+        parser.error(f"--k must be between 3 and --size, got {args.k}")
+    if args.size > 5 and not all(p["time_limit_ms"] for p in (args.player_a, args.player_b) if p["difficulty"] != "Easy"):
+        parser.error("boards beyond 5x5 need a time budget per searching player, e.g. -a Hard:500")
+
+    players = {"A": args.player_a, "B": args.player_b}
+    for config in players.values():
+        config["position_cache"] = args.cache
+    out = open(args.out, "w") if args.out else sys.stdout
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in run_tournament(args.games, args.size, players, args.seed, args.workers, args.k):
+            out.write(json.dumps(result, separators=(",", ":")) + "\n")
+            out.flush()
+            results.append({"winner": result["winner"], "move_ms": result["move_ms"]})
+    finally:
+        if out is not sys.stdout: out.close()
+    summarize(results, players, time.perf_counter() - start)
+    return 0
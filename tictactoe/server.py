@@ -0,0 +1,344 @@
+# Many games against the AI over TCP, one JSON object per line each way:
+#   python -m tictactoe serve --port 8765 --workers 4
+#   python -m tictactoe loadgen --port 8765 --connections 200 --games 2000
+# Requests carry an optional "id" that is echoed back; replies have "ok" and either the
+# result or "error". The player is X and the AI is O.
+#   {"op": "new", "size": 3, "k": 3, "difficulty": "Hard", "first": "O", "time_ms": 200}
+#       -> {"ok": true, "game": "17", "ai_move": [1, 1] or null, "result": null}
+#   {"op": "move", "game": "17", "row": 0, "col": 0}
+#       -> {"ok": true, "ai_move": [2, 2] or null, "result": null, "X", "O" or "draw"}
+#   {"op": "close", "game": "17"}, {"op": "stats"}
+import argparse
+import asyncio
+import collections
+import json
+import os
+import sys
+import time
+
+from .selfplay import DIFFICULTIES, _make_ai, new_game
+
+# --- Latency Histograms ---
+# Log-linear buckets over microseconds: four per power of two, so a percentile is
+# never more than 25% above the true value, whatever the range, in a fixed 160 counters.
+SUB_BUCKETS = 4
+HISTOGRAM_BUCKETS = 40 * SUB_BUCKETS
+
+def bucket_index(us):
+    if us < SUB_BUCKETS: return us
+    exponent = us.bit_length() - 3 # Keeps the top 3 bits: the leading 1 and the sub-bucket
+    return min(exponent * SUB_BUCKETS + (us >> exponent), HISTOGRAM_BUCKETS - 1)
+
+def bucket_upper_us(index):
+    if index < SUB_BUCKETS: return index + 1
+    exponent, sub = divmod(index, SUB_BUCKETS)
+    return (SUB_BUCKETS + sub + 1) << (exponent - 1)
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bucket_index(int(seconds * 1_000_000))] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max: self.max = seconds
+
+    def merge(self, other):
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        # Upper bound of the bucket holding the p-th percentile, in ms
+        if not self.count: return 0.0
+        rank, seen = p / 100 * self.count, 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank: return min(bucket_upper_us(i) / 1000, self.max * 1000)
+        return self.max * 1000
+
+    def as_dict(self):
+        return {"count": self.count, "mean_ms": round(1000 * self.total / self.count, 3) if self.count else 0.0,
+                "p50_ms": self.percentile(50), "p90_ms": self.percentile(90), "p99_ms": self.percentile(99),
+                "max_ms": round(1000 * self.max, 3),
+                "buckets": {str(bucket_upper_us(i) / 1000): count for i, count in enumerate(self.counts) if count}}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        for upper_ms, count in data["buckets"].items():
+            histogram.counts[bucket_index(round(float(upper_ms) * 1000) - 1)] += count
+        histogram.count, histogram.max = data["count"], data["max_ms"] / 1000
+        histogram.total = data["mean_ms"] * data["count"] / 1000
+        return histogram
+
+def summarize_histogram(name, data):
+    return (f"{name:<8}{data['count']:>9,}{data['mean_ms']:>9.2f}{data['p50_ms']:>9.2f}"
+            f"{data['p90_ms']:>9.2f}{data['p99_ms']:>9.2f}{data['max_ms']:>9.2f}")
+
+# --- Searches ---
+# Run in the process pool. Each worker process keeps one AI per variant, difficulty and
+# time budget, so its tables stay warm across requests and never mix board variants.
+_SEARCH_AIS = {}
+
+def _search(size, k, moves, difficulty, time_limit_ms):
+    game = new_game(size, k)
+    for row, col, player in moves:
+        game.make_move(row, col, player)
+    key = (size, k, difficulty, time_limit_ms)
+    if key not in _SEARCH_AIS:
+        _SEARCH_AIS[key] = _make_ai({"difficulty": difficulty, "time_limit_ms": time_limit_ms})
+    move = _SEARCH_AIS[key].get_best_move(game)
+    return tuple(move) if move else None
+
+class ServerBusy(Exception):
+    pass
+
+class RequestError(Exception):
+    pass
+
+class Session:
+    def __init__(self, game_id, game, difficulty, time_limit_ms):
+        self.id = game_id
+        self.game = game
+        self.difficulty = difficulty
+        self.time_limit_ms = time_limit_ms
+        self.moves = [] # (row, col, player), replayed by the pool worker
+        self.result = None
+        self.busy = False # A request for this game is in progress
+
+    def play(self, row, col, player):
+        if not self.game.make_move(row, col, player): raise RuntimeError(f"illegal move {row},{col} for {player}")
+        self.moves.append((row, col, player))
+        winner, _, _ = self.game.check_winner()
+        if winner: self.result = winner
+        elif self.game.is_board_full(): self.result = "draw"
+
+    def undo(self):
+        row, col, _ = self.moves.pop()
+        self.game.unmake_move(row, col)
+        self.result = None
+
+# --- Server ---
+DEFAULT_TIME_MS = 200 # Per AI move on boards beyond 3x3 when the request gives none
+MAX_LINE = 1 << 16
+
+class GameServer:
+    def __init__(self, workers=None, max_sessions=10_000, max_queue=1_000, max_inflight=16, max_time_ms=1_000):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_sessions = max_sessions
+        self.max_queue = max_queue # Searches waiting for a pool slot before new ones are refused with "busy"
+        self.max_inflight = max_inflight # Pipelined requests per connection before it stops being read
+        self.max_time_ms = max_time_ms
+        self.executor = None
+        self.server = None
+        self.sessions = {}
+        self.next_id = 0
+        self.searches = {} # Position key -> task, shared by every request for that position
+        self.search_slots = asyncio.Semaphore(self.workers * 2) # Keeps each worker fed without queueing in the pool
+        self.queued = 0
+        self.histograms = {op: LatencyHistogram() for op in ("new", "move", "search")}
+        self.counters = collections.Counter()
+        self.started = time.perf_counter()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        from concurrent.futures import ProcessPoolExecutor
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def handle_connection(self, reader, writer):
+        self.counters["connections"] += 1
+        games = set()
+        inflight = asyncio.Semaphore(self.max_inflight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError: # Longer than MAX_LINE
+                    await self.send(writer, write_lock, {"ok": False, "error": "line too long"})
+                    break
+                if not line: break
+                # Stops reading once max_inflight requests are pending, so a client that
+                # pipelines faster than it is served is slowed down by TCP flow control
+                await inflight.acquire()
+                task = asyncio.create_task(self.serve_line(line, games, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(lambda task: (tasks.discard(task), inflight.release()))
+        except ConnectionError:
+            pass
+        finally:
+            if tasks: await asyncio.gather(*tasks, return_exceptions=True)
+            for game_id in games:
+                self.sessions.pop(game_id, None)
+            writer.close()
+
+    async def send(self, writer, write_lock, reply):
+        async with write_lock: # One whole line per reply, and at most one drain() waiting
+            writer.write(json.dumps(reply, separators=(",", ":")).encode() + b"\n")
+            await writer.drain()
+
+    async def serve_line(self, line, games, writer, write_lock):
+        start = time.perf_counter()
+        request_id = op = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict): raise RequestError("expected a JSON object")
+            request_id, op = request.get("id"), request.get("op")
+            handler = {"new": self.start_game, "move": self.move, "close": self.close_game, "stats": self.stats}.get(op)
+            if handler is None: raise RequestError(f"unknown op {op!r}")
+            reply = dict(await handler(request, games), ok=True)
+        except (ValueError, RequestError) as error:
+            reply = {"ok": False, "error": str(error)}
+        except ServerBusy:
+            self.counters["busy"] += 1
+            reply = {"ok": False, "error": "busy", "retry_after_ms": 50}
+        except Exception as error: # A failed search; the connection and its other games carry on
+            self.counters["errors"] += 1
+            reply = {"ok": False, "error": f"internal error: {error!r}"}
+        if request_id is not None: reply["id"] = request_id
+        try:
+            await self.send(writer, write_lock, reply)
+        except ConnectionError:
+            return
+        if op in self.histograms and reply["ok"]: self.histograms[op].record(time.perf_counter() - start)
+
+    def session(self, request, games):
+        game_id = request.get("game")
+        if game_id not in games: raise RequestError(f"no game {game_id!r} on this connection")
+        return self.sessions[game_id]
+
+    async def start_game(self, request, games):
+        if len(self.sessions) >= self.max_sessions: raise ServerBusy
+        size = request.get("size", 3)
+        k = request.get("k") or size
+        difficulty = request.get("difficulty", "Hard")
+        if not isinstance(size, int) or not isinstance(k, int) or not 3 <= k <= size <= 15:
+            raise RequestError("need 3 <= k <= size <= 15")
+        if difficulty not in DIFFICULTIES: raise RequestError(f"difficulty must be one of {', '.join(DIFFICULTIES)}")
+        time_limit_ms = request.get("time_ms") or (DEFAULT_TIME_MS if size > 3 else None)
+        if time_limit_ms is not None: time_limit_ms = min(int(time_limit_ms), self.max_time_ms)
+        self.next_id += 1
+        session = Session(str(self.next_id), new_game(size, k), difficulty, time_limit_ms)
+        self.sessions[session.id] = session
+        games.add(session.id)
+        ai_move = None
+        if request.get("first") == "O":
+            session.busy = True
+            try:
+                ai_move = await self.ai_move(session)
+            except BaseException:
+                games.discard(session.id) # No game to come back to: the client starts a new one
+                self.sessions.pop(session.id, None)
+                raise
+            finally:
+                session.busy = False
+        self.counters["games"] += 1
+        return {"game": session.id, "ai_move": ai_move, "result": session.result}
+
+    async def move(self, request, games):
+        session = self.session(request, games)
+        if session.busy: raise RequestError("previous request for this game still in progress")
+        if session.result is not None: raise RequestError("game is over")
+        row, col = request.get("row"), request.get("col")
+        if not isinstance(row, int) or not isinstance(col, int) or not (0 <= row < session.game.size and 0 <= col < session.game.size):
+            raise RequestError("row and col must be on the board")
+        if (row, col) in {(r, c) for r, c, _ in session.moves}: raise RequestError("cell is taken")
+        session.busy = True
+        try:
+            session.play(row, col, "X")
+            ai_move = None
+            if session.result is None:
+                try:
+                    ai_move = await self.ai_move(session)
+                except BaseException:
+                    # Busy, a failed search or a dropped client: X's move is taken back too, so
+                    # the game is as it was and a retry plays the same move again
+                    session.undo()
+                    raise
+            self.counters["moves"] += 1
+        finally:
+            session.busy = False
+        return {"ai_move": ai_move, "result": session.result}
+
+    async def close_game(self, request, games):
+        session = self.session(request, games)
+        games.discard(session.id)
+        del self.sessions[session.id]
+        return {}
+
+    async def stats(self, request, games):
+        elapsed = time.perf_counter() - self.started
+        return {"uptime_s": round(elapsed, 1), "sessions": len(self.sessions), "queued": self.queued,
+                "counters": dict(self.counters), "moves_per_s": round(self.counters["moves"] / elapsed, 1),
+                "latency": {op: histogram.as_dict() for op, histogram in self.histograms.items()}}
+
+    async def ai_move(self, session):
+        game = session.game
+        key = (game.size, getattr(game, "k", game.size), game.x_bits, game.o_bits, session.difficulty, session.time_limit_ms)
+        task = self.searches.get(key)
+        if task is None:
+            if self.queued >= self.max_queue: raise ServerBusy
+            task = self.searches[key] = asyncio.create_task(self.search(key, session))
+        else:
+            self.counters["coalesced"] += 1
+        move = await asyncio.shield(task) # A dropped client must not cancel a search others are waiting on
+        if move is None: raise RuntimeError("search returned no move")
+        session.play(*move, "O") # Raises on an occupied cell, so a bad search never reaches the move list
+        return list(move)
+
+    async def search(self, key, session):
+        # One pool search per distinct position; everyone who asked for it awaits this task
+        size, k, moves = session.game.size, getattr(session.game, "k", session.game.size), list(session.moves)
+        self.queued += 1
+        try:
+            async with self.search_slots:
+                self.queued -= 1
+                start = time.perf_counter()
+                move = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, _search, size, k, moves, session.difficulty, session.time_limit_ms)
+                self.histograms["search"].record(time.perf_counter() - start)
+                self.counters["searches"] += 1
+                return move
+        finally:
+            if self.searches.get(key) is asyncio.current_task(): del self.searches[key]
+
+async def serve(args):
+    server = GameServer(args.workers, args.max_sessions, args.max_queue, args.max_inflight, args.max_time_ms)
+    host, port = await server.start(args.host, args.port)
+    print(f"Serving on {host}:{port} with {server.workers} search workers", file=sys.stderr)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python -m tictactoe serve", description="Host games against the AI over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Search processes")
+    parser.add_argument("--max-sessions", type=int, default=10_000)
+    parser.add_argument("--max-queue", type=int, default=1_000, help="Waiting searches before requests get \"busy\"")
+    parser.add_argument("--max-inflight", type=int, default=16, help="Pipelined requests per connection")
+    parser.add_argument("--max-time-ms", type=int, default=1_000, help="Cap on a request's time_ms")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
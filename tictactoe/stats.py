@@ -0,0 +1,46 @@
+# --- Search Instrumentation ---
+class SearchStats:
+    # What one get_best_move call cost. `source` says how the move was chosen:
+    # "random", "opening book", "perfect db", "position cache", "search", "iterative deepening",
+    # "mcts", "forced move" or "cancelled".
+    def __init__(self, source, move=None, nodes=0, leaf_evaluations=0, cutoffs_per_ply=None, max_ply=0,
+                 depth_completed=0, tt_hits=0, tt_misses=0, cache_hits=0, wall_time_ms=0.0):
+        self.source = source
+        self.move = move
+        self.nodes = nodes
+        self.leaf_evaluations = leaf_evaluations
+        self.cutoffs_per_ply = cutoffs_per_ply or {} # {ply: beta cutoffs}, ply 1 is the reply to the root move
+        self.max_ply = max_ply # Deepest ply visited below the root
+        self.depth_completed = depth_completed # Plies fully searched (the last finished iteration when deepening)
+        self.tt_hits = tt_hits
+        self.tt_misses = tt_misses
+        self.cache_hits = cache_hits # Solved subtrees answered by the persistent position cache
+        self.wall_time_ms = wall_time_ms
+
+    @property
+    def cutoffs(self):
+        return sum(self.cutoffs_per_ply.values())
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes / (self.wall_time_ms / 1000) if self.wall_time_ms else 0.0
+
+    def as_dict(self):
+        return {"source": self.source, "move": self.move, "nodes": self.nodes, "leaf_evaluations": self.leaf_evaluations,
+                "cutoffs_per_ply": self.cutoffs_per_ply, "max_ply": self.max_ply, "depth_completed": self.depth_completed,
+                "tt_hits": self.tt_hits, "tt_misses": self.tt_misses, "cache_hits": self.cache_hits,
+                "wall_time_ms": round(self.wall_time_ms, 3)}
+
+    def summary(self):
+        if not self.nodes:
+            return f"{self.source} · {self.wall_time_ms:.1f} ms"
+        probes = self.tt_hits + self.tt_misses
+        cutoffs = " ".join(f"{ply}:{count}" for ply, count in sorted(self.cutoffs_per_ply.items()))
+        return (f"{self.source} · depth {self.depth_completed} (max ply {self.max_ply}) · {self.wall_time_ms:.1f} ms\n"
+                f"{self.nodes:,} nodes ({self.nodes_per_second:,.0f}/s) · {self.leaf_evaluations:,} leaves · "
+                f"TT {self.tt_hits / probes if probes else 0:.0%} of {probes:,}"
+                f"{f' · cache {self.cache_hits:,}' if self.cache_hits else ''}\n"
+                f"cutoffs {self.cutoffs:,}: {cutoffs or '-'}")
+
+    def __repr__(self):
+        return f"SearchStats({self.as_dict()})"
@@ -0,0 +1,112 @@
+import random
+from collections import OrderedDict
+
+# --- Transposition Table ---
+# Positions are keyed by a Zobrist hash of their canonical orientation: the hash is
+# maintained for all 8 rotations/reflections at once and the smallest one is the key.
+ZOBRIST_SEED = 0x5EED_7A7
+_ZOBRIST_KEYS = {}
+
+def board_symmetries(n):
+    # Cell permutations for the 8 symmetries of an n x n board, identity first
+    perms = []
+    for rotation in range(4):
+        for reflect in (False, True):
+            perm = []
+            for r in range(n):
+                for c in range(n):
+                    rr, cc = r, (n - 1 - c if reflect else c)
+                    for _ in range(rotation):
+                        rr, cc = cc, n - 1 - rr
+                    perm.append(rr * n + cc)
+            perms.append(tuple(perm))
+    return perms
+
+def get_zobrist_keys(n):
+    # {player: [per-cell tuple of 8 keys, one per symmetry]}, seeded so every process agrees
+    if n not in _ZOBRIST_KEYS:
+        rng = random.Random(ZOBRIST_SEED + n)
+        base = {player: [rng.getrandbits(64) for _ in range(n * n)] for player in ("X", "O")}
+        perms = board_symmetries(n)
+        _ZOBRIST_KEYS[n] = {player: [tuple(keys[perm[cell]] for perm in perms) for cell in range(n * n)]
+                            for player, keys in base.items()}
+    return _ZOBRIST_KEYS[n]
+
+SIDE_TO_MOVE_KEY = random.Random(ZOBRIST_SEED).getrandbits(64)
+
+def variant_key(size, k=None):
+    # Mixed into every key so one table can hold several win lengths of the same board
+    # size; 0 for the standard game, whose cached keys predate it
+    if k is None or k == size: return 0
+    return random.Random(ZOBRIST_SEED ^ (size << 8 | k)).getrandbits(64)
+
+class ZobristHasher:
+    def __init__(self, size, k=None):
+        self.size = size
+        self.k = k or size
+        self.keys = get_zobrist_keys(size)
+        self.variant = variant_key(size, k)
+        self.hashes = [0] * 8
+
+    def reset(self, game):
+        self.hashes = [0] * 8
+        for r, row in enumerate(game.board):
+            for c, cell in enumerate(row):
+                if cell: self.toggle(r, c, cell)
+
+    def toggle(self, row, col, player):
+        keys = self.keys[player][row * self.size + col]
+        hashes = self.hashes
+        for i in range(8):
+            hashes[i] ^= keys[i]
+
+    def key(self, is_maximizing_player):
+        return min(self.hashes) ^ self.variant ^ (SIDE_TO_MOVE_KEY if is_maximizing_player else 0)
+
+    def symmetry(self):
+        # Which of board_symmetries(size) maps the board onto the orientation key() hashes
+        return self.hashes.index(min(self.hashes))
+
+class TranspositionTable:
+    EXACT, LOWER, UPPER = 0, 1, 2
+    SOLVED = 1 << 30 # Depth of an entry whose subtree never hit the search horizon
+
+    def __init__(self, capacity=200_000):
+        self.capacity = capacity
+        self.entries = OrderedDict() # key -> (remaining_depth, score, flag), in LRU order
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key, remaining_depth):
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < remaining_depth:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(self, key, remaining_depth, score, flag):
+        if self.capacity <= 0: return
+        entry = self.entries.get(key)
+        if entry is not None:
+            if entry[0] > remaining_depth: return # Depth-preferred: keep the deeper result
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        self.entries[key] = (remaining_depth, score, flag)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        probes = self.hits + self.misses
+        return {"entries": len(self.entries), "capacity": self.capacity, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / probes if probes else 0.0}